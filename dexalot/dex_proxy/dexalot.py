@@ -16,6 +16,9 @@ from pyutils.exchange_connectors import ConnectorFactory, ConnectorType
 from pyutils.exchange_apis import ApiFactory
 from py_dex_common.dexes.dex_common import DexCommon
 
+_SIDE_BY_NAME = {'BUY': Side.BUY, 'SELL': Side.SELL}
+
+
 class Dexalot(DexCommon):
     CHANNELS = ['ORDER', 'TRADE']
 
@@ -142,8 +145,9 @@ class Dexalot(DexCommon):
             symbol = params['symbol']
             price = Decimal(params['price'])
             qty = Decimal(params['qty'])
-            assert params['side'] == 'BUY' or params['side'] == 'SELL', 'Unknown order side'
-            side = Side.BUY if params['side'] == 'BUY' else Side.SELL
+            side = _SIDE_BY_NAME.get(params['side'])
+            if side is None:
+                raise ValueError('Unknown order side')
             type1 = OrderType1(params['type1'])
             type2 = OrderType2(params['type2'])
             gas_price_wei = params['gas_price_wei']
@@ -117,8 +117,9 @@ class KuruHandler:
                 "error_message": f"Input params are invalid: {', '.join(e.args[0])}",
             }
         
-        if client_order_id in self._orders_cache:
-            return 200, self._orders_cache[client_order_id]
+        order = self._orders_cache.get(client_order_id)
+        if order is not None:
+            return 200, order
         else:
             # TODO: add error response object
             return 404, {
@@ -156,25 +157,25 @@ class KuruHandler:
             self.nonce_manager = None
 
     def cleanup_order_completion(self, client_order_id: str) -> None:
-        if client_order_id in self._order_completions:
-            del self._order_completions[client_order_id]
+        self._order_completions.pop(client_order_id, None)
 
     async def on_create_order_transaction_completed(self, tx_receipt, external_client_order_id: str, orderbook_address: str) -> None:
-        if external_client_order_id in self._orders_cache:
+        order = self._orders_cache.get(external_client_order_id)
+        if order is not None:
             if tx_receipt.status == 1:
                 # Extract order_id from receipt
                 client = self._clients.get(orderbook_address)
                 if client:
                     order_id = client.orderbook.get_order_id_from_receipt(tx_receipt)
                     if order_id is not None:
-                        self._orders_cache[external_client_order_id].order_id = str(order_id)
+                        order.order_id = str(order_id)
                         self._client_to_order_id_map[external_client_order_id] = order_id
             else:
-                self._orders_cache[external_client_order_id].status = OrderStatus.REJECTED
-            self._orders_cache[external_client_order_id].last_update_timestamp_ns = get_current_timestamp_ns()
+                order.status = OrderStatus.REJECTED
+            order.last_update_timestamp_ns = get_current_timestamp_ns()
 
-        if external_client_order_id in self._order_completions:
-            completion = self._order_completions[external_client_order_id]
+        completion = self._order_completions.get(external_client_order_id)
+        if completion is not None:
             completion.result_status = tx_receipt.status
             completion.event.set()
 
@@ -300,12 +301,9 @@ class KuruHandler:
             error_message = str(ex).lower()
             if "not found" in error_message or "does not exist" in error_message:
                 self._logger.info(f"Order {client_order_id} not found on exchange, removing from local cache")
-                if client_order_id in self._orders_cache:
-                    del self._orders_cache[client_order_id]
-                if client_order_id in self._client_to_order_id_map:
-                    del self._client_to_order_id_map[client_order_id]
-                if client_order_id in self._order_completions:
-                    del self._order_completions[client_order_id]
+                self._orders_cache.pop(client_order_id, None)
+                self._client_to_order_id_map.pop(client_order_id, None)
+                self._order_completions.pop(client_order_id, None)
                     
                 return 404, OrderErrorResponse(
                     error_code=ErrorCode.ORDER_NOT_FOUND,
@@ -357,13 +355,14 @@ class KuruHandler:
                     
                     # Remove these orders from our cache since they're no longer active
                     for client_order_id, order_id in order_list:
-                        if client_order_id in self._orders_cache:
+                        cached_order = self._orders_cache.get(client_order_id)
+                        if cached_order is not None:
                             # Update status to reflect reality
                             if "filled" in error_message:
-                                self._orders_cache[client_order_id].status = OrderStatus.FILLED
+                                cached_order.status = OrderStatus.FILLED
                             else:
-                                self._orders_cache[client_order_id].status = OrderStatus.CANCELLED
-                            self._orders_cache[client_order_id].last_update_timestamp_ns = get_current_timestamp_ns()
+                                cached_order.status = OrderStatus.CANCELLED
+                            cached_order.last_update_timestamp_ns = get_current_timestamp_ns()
                             cancelled_orders_ids.append(client_order_id)
                             self._logger.info(f"Marked order {client_order_id} as already processed")
                 else:
@@ -403,10 +402,8 @@ class KuruHandler:
         # Remove stale orders from cache
         for client_order_id in stale_orders:
             self._logger.info(f"Removing stale order {client_order_id} - no order_id found")
-            if client_order_id in self._orders_cache:
-                del self._orders_cache[client_order_id]
-            if client_order_id in self._order_completions:
-                del self._order_completions[client_order_id]
+            self._orders_cache.pop(client_order_id, None)
+            self._order_completions.pop(client_order_id, None)
                 
         return orders_by_market
 
@@ -423,13 +420,12 @@ class KuruHandler:
                 error_message=f"Input params are invalid: {', '.join(e.args[0])}"
             ), None
 
-        if client_order_id not in self._orders_cache:
+        order = self._orders_cache.get(client_order_id)
+        if order is None:
             self._logger.info(f"Order {client_order_id} not found in cache, removing from tracking if exists")
             # Clean up any stale references
-            if client_order_id in self._client_to_order_id_map:
-                del self._client_to_order_id_map[client_order_id]
-            if client_order_id in self._order_completions:
-                del self._order_completions[client_order_id]
+            self._client_to_order_id_map.pop(client_order_id, None)
+            self._order_completions.pop(client_order_id, None)
             return 404, OrderErrorResponse(
                 error_code=ErrorCode.ORDER_NOT_FOUND,
                 error_message=f"Order with client_order_id {client_order_id} not found"
@@ -439,25 +435,19 @@ class KuruHandler:
         if order_id is None:
             self._logger.info(f"Order ID not found for {client_order_id}, removing from cache")
             # Remove the order from cache since it doesn't have a valid order_id
-            if client_order_id in self._orders_cache:
-                del self._orders_cache[client_order_id]
-            if client_order_id in self._order_completions:
-                del self._order_completions[client_order_id]
+            self._orders_cache.pop(client_order_id, None)
+            self._order_completions.pop(client_order_id, None)
             return 404, OrderErrorResponse(
                 error_code=ErrorCode.ORDER_NOT_FOUND,
                 error_message=f"Order ID not found for client_order_id {client_order_id}"
             ), None
 
-        order = self._orders_cache[client_order_id]
         if order.status != OrderStatus.OPEN:
             self._logger.info(f"Order {client_order_id} is not open (status: {order.status}), removing from cache")
             # Remove non-open orders from cache as they can't be cancelled
-            if client_order_id in self._orders_cache:
-                del self._orders_cache[client_order_id]
-            if client_order_id in self._client_to_order_id_map:
-                del self._client_to_order_id_map[client_order_id]
-            if client_order_id in self._order_completions:
-                del self._order_completions[client_order_id]
+            self._orders_cache.pop(client_order_id, None)
+            self._client_to_order_id_map.pop(client_order_id, None)
+            self._order_completions.pop(client_order_id, None)
             return 400, OrderErrorResponse(
                 error_code=ErrorCode.INVALID_PARAMETER,
                 error_message=f"Order with client_order_id {client_order_id} is not open (status: {order.status})"
@@ -578,12 +568,9 @@ class KuruHandler:
         # Clean up stale orders immediately
         for client_order_id in stale_orders:
             self._logger.info(f"Removing stale order {client_order_id} - no order_id found during monitoring")
-            if client_order_id in self._orders_cache:
-                del self._orders_cache[client_order_id]
-            if client_order_id in self._order_completions:
-                del self._order_completions[client_order_id]
-            if client_order_id in self._client_to_order_id_map:
-                del self._client_to_order_id_map[client_order_id]
+            self._orders_cache.pop(client_order_id, None)
+            self._order_completions.pop(client_order_id, None)
+            self._client_to_order_id_map.pop(client_order_id, None)
         
         # Process problematic orders (only remove those without order_id)
         for client_order_id, order, reason in problematic_orders:
@@ -599,12 +586,9 @@ class KuruHandler:
             # For orders without order_id, we can't query them - just remove
             if reason == "missing_order_id":
                 self._logger.info(f"Removing problematic order {client_order_id}: {reason}")
-                if client_order_id in self._orders_cache:
-                    del self._orders_cache[client_order_id]
-                if client_order_id in self._order_completions:
-                    del self._order_completions[client_order_id]
-                if client_order_id in self._client_to_order_id_map:
-                    del self._client_to_order_id_map[client_order_id]
+                self._orders_cache.pop(client_order_id, None)
+                self._order_completions.pop(client_order_id, None)
+                self._client_to_order_id_map.pop(client_order_id, None)
                 
         except Exception as e:
             self._logger.error(f"Error handling problematic order {client_order_id}: {e}", exc_info=True)
@@ -668,64 +652,71 @@ class KuruHandler:
             return True
 
     async def _get_wallet_balance(self, token_configs: Dict[str, dict]) -> Dict[str, Decimal]:
-        """Get wallet balance for specified tokens using async web3"""
+        """Get wallet balance for specified tokens using async web3, querying all tokens concurrently"""
         async_web3 = AsyncWeb3(AsyncHTTPProvider(self._config["url"]))
         account = Account.from_key(self._private_key)
         wallet_address = account.address
-        
-        balances = {}
-        
-        for token_name, token_config in token_configs.items():
+
+        async def get_token_balance(token_name: str, token_config: dict) -> Decimal:
             token_address = token_config["address"]
             token_decimals = token_config["decimals"]
-            
+
             if token_address.lower() == "0x0000000000000000000000000000000000000000":
                 # Native token
                 balance_wei = await async_web3.eth.get_balance(wallet_address)
-                balance = Decimal(str(from_wei(balance_wei, 'ether')))
-                balances[token_name] = balance
+                return Decimal(str(from_wei(balance_wei, 'ether')))
+
+            # ERC20 token
+            try:
+                contract = async_web3.eth.contract(address=async_web3.to_checksum_address(token_address), abi=self._erc20_abi)
+                balance_raw = await contract.functions.balanceOf(wallet_address).call()
+                return Decimal(balance_raw) / Decimal(10 ** token_decimals)
+            except Exception as e:
+                self._logger.error(f"Failed to get balance for token {token_name} ({token_address}): {e}")
+                return Decimal("0")
+
+        token_names = list(token_configs)
+        balances = await asyncio.gather(
+            *[get_token_balance(token_name, token_configs[token_name]) for token_name in token_names])
+        return dict(zip(token_names, balances))
+
+    async def _get_margin_balance(self, token_configs: Dict[str, dict]) -> Dict[str, Decimal]:
+        """Get margin account balance for specified tokens, querying all tokens concurrently"""
+        wallet_address = str(self._margin_account.wallet_address)
+
+        async def get_token_balance(token_name: str, token_config: dict) -> Decimal:
+            token_address = token_config["address"]
+            token_decimals = token_config["decimals"]
+
+            balance_wei = await self._margin_account.get_balance(wallet_address, token_address)
+
+            # Convert balance using proper decimals
+            if token_decimals == 18:
+                balance_decimal = Decimal(str(from_wei(balance_wei, 'ether')))
             else:
-                # ERC20 token
-                try:
-                    contract = async_web3.eth.contract(address=async_web3.to_checksum_address(token_address), abi=self._erc20_abi)
-                    balance_raw = await contract.functions.balanceOf(wallet_address).call()
-                    balance = Decimal(balance_raw) / Decimal(10 ** token_decimals)
-                    balances[token_name] = balance
-                except Exception as e:
-                    self._logger.error(f"Failed to get balance for token {token_name} ({token_address}): {e}")
-                    balances[token_name] = Decimal("0")
-        
-        return balances
+                balance_decimal = Decimal(balance_wei) / Decimal(10 ** token_decimals)
+
+            self._logger.info(f"Margin account balance: {balance_decimal} for token {token_name}")
+            return balance_decimal
+
+        token_names = list(token_configs)
+        balances = await asyncio.gather(
+            *[get_token_balance(token_name, token_configs[token_name]) for token_name in token_names])
+        return dict(zip(token_names, balances))
 
     async def balance(self, path, params, received_at_ms) -> Tuple[int, Union[BalanceResponse, OrderErrorResponse]]:
         """Get wallet and margin account balances"""
         try:
-            # Get wallet balances
-            wallet_balances = await self._get_wallet_balance(self._common_tokens)
-            
-            # Get margin account balances 
-            margin_balances = {}
-            for token_name, token_config in self._common_tokens.items():
-                token_address = token_config["address"]
-                token_decimals = token_config["decimals"]
-                
-                balance_wei = await self._margin_account.get_balance(str(self._margin_account.wallet_address), token_address)
-                
-                # Convert balance using proper decimals
-                if token_decimals == 18:
-                    balance_decimal = Decimal(str(from_wei(balance_wei, 'ether')))
-                else:
-                    balance_decimal = Decimal(balance_wei) / Decimal(10 ** token_decimals)
-                
-                margin_balances[token_name] = balance_decimal
-                self._logger.info(f"Margin account balance: {balance_decimal} for token {token_name}")
+            # Wallet and margin account balances of all tokens are read concurrently
+            wallet_balances, margin_balances = await asyncio.gather(
+                self._get_wallet_balance(self._common_tokens),
+                self._get_margin_balance(self._common_tokens))
             
             # Convert to BalanceItem format
             wallet_balance_items = []
             exchange_wallet_balance_items = []
             
-            for token_name in self._common_tokens.keys():
-                token_config = self._common_tokens[token_name]
+            for token_name, token_config in self._common_tokens.items():
                 symbol = token_config["symbol"]
                 
                 # Wallet balance
@@ -1,3 +1,4 @@
+import json
 import logging
 import signal
 import functools
@@ -16,6 +17,7 @@ _logger = logging.getLogger('DexProxy')
 
 class DexProxy:
     class Subscription:
+        __slots__ = ('ws_ref',)
 
         def __init__(self, ws):
             self.ws_ref = weakref.ref(ws)
@@ -113,11 +115,20 @@ class DexProxy:
         await self.__server.send_json(ws, reply)
 
     async def on_event(self, channel, event):
-        _logger.debug(f'channel={channel}, event={event}')
-        for sub in self.__subscriptions[channel]:
+        _logger.debug('channel=%s, event=%s', channel, event)
+        subscriptions = self.__subscriptions.get(channel)
+        if not subscriptions:
+            return
+        try:
+            data = json.dumps(event)
+        except Exception:
+            _logger.exception('Could not serialise event on channel=%s: %s', channel, event)
+            return
+        # clients can (un)subscribe while we are awaiting a send, so iterate over a snapshot of the set
+        for sub in tuple(subscriptions):
             ws = sub.ws_ref()
             if ws is not None:
-                await self.__server.send_json(ws, event)
+                await self.__server.send_str(ws, data)
 
     def stop(self, sig):
         _logger.info(f'Receiving signal {sig}')
@@ -154,6 +165,7 @@ class DexProxy:
         app_health.stopping()
 
         await self.__server.stop()
+        await self.__exchange.stop()
 
         app_health.stopped()
 
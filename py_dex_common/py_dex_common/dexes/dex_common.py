@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 from abc import ABC, abstractmethod
@@ -26,6 +27,9 @@ class DexCommon(ABC):
     Any dex specific logic should be handled in a subclass.
     """
 
+    # request types /private/cancel-all accepts
+    _CANCEL_ALL_REQUEST_TYPES = ('ORDER', 'TRANSFER', 'APPROVE', 'WRAP_UNWRAP')
+
     def __init__(self, pantheon: Pantheon, config, server: "WebServer", event_sink: "DexProxy"):
         self.pantheon = pantheon
 
@@ -40,6 +44,11 @@ class DexCommon(ABC):
         self._request_cache = RequestsCache(pantheon, config['request_cache'], self)
         self._transactions_status_poller = TransactionsStatusPoller(pantheon, config['transactions_status_poller'],
                                                                     self)
+        # Bounds the receipt requests in flight at once, to stay within the open sockets/files limit
+        self.__receipt_requests_semaphore = asyncio.Semaphore(
+            config['transactions_status_poller'].get('max_concurrent_receipt_requests', 50))
+        # Bounds the cancel transactions cancel-all submits at once, to stay within the RPC provider's burst limits
+        self._cancel_all_semaphore = asyncio.Semaphore(config.get('max_concurrent_cancel_all_requests', 20))
 
         if 'max_allowed_gas_price_gwei' in config:
             self.__max_allowed_gas_price_wei = config['max_allowed_gas_price_gwei'] * 10 ** 9
@@ -185,6 +194,23 @@ class DexCommon(ABC):
     async def get_transaction_receipt(self, request, tx_hash):
         pass
 
+    async def get_transaction_receipts(self, tx_hash_to_request: dict) -> dict:
+        """
+        Fetches the receipts of the transactions polled by `TransactionsStatusPoller`.
+        Returns tx_hash -> receipt, or the exception raised while fetching it.
+
+        Receipts are requested concurrently with `get_transaction_receipt`, one call per transaction, bounded by
+        a semaphore. This is an overridable hook: a dex whose api supports JSON-RPC batching can override it to
+        fetch them in one round trip.
+        """
+        async def get_receipt(tx_hash):
+            async with self.__receipt_requests_semaphore:
+                return await self.get_transaction_receipt(tx_hash_to_request[tx_hash], tx_hash)
+
+        tx_hashes = list(tx_hash_to_request)
+        receipts = await asyncio.gather(*[get_receipt(tx_hash) for tx_hash in tx_hashes], return_exceptions=True)
+        return dict(zip(tx_hashes, receipts))
+
     @abstractmethod
     def _get_gas_price(self, request, priority_fee: PriorityFee):
         pass
@@ -215,8 +241,13 @@ class DexCommon(ABC):
         else:
             self._withdrawal_address_whitelists = self._withdrawal_address_whitelists_from_res_file
 
+    async def stop(self):
+        # cancels the background loops started in start(), so a re-created dex does not leave them polling
+        await self._transactions_status_poller.stop()
+        await self._request_cache.stop()
+
     def get_request(self, client_request_id) -> Optional[Request]:
-        self._logger.debug(f'Getting request: client_request_id={client_request_id}')
+        self._logger.debug('Getting request: client_request_id=%s', client_request_id)
         return self._request_cache.get(client_request_id)
 
     async def __get_request_status(self, path, params, received_at_ms):
@@ -240,7 +271,7 @@ class DexCommon(ABC):
                 'Unknown request type'
             request_type = RequestType[params['request_type']]
 
-            self._logger.debug(f'Getting all open requests: request_type={request_type.name}')
+            self._logger.debug('Getting all open requests: request_type=%s', request_type.name)
             return 200, [request.to_dict() for request in self._request_cache.get_all(request_type)]
 
         except Exception as e:
@@ -286,7 +317,7 @@ class DexCommon(ABC):
             if not ok:
                 return 400, {'error': {'message': reason}}
 
-            self._logger.debug(f'Canceling={request}, gas_price_wei={gas_price_wei}')
+            self._logger.debug('Canceling=%s, gas_price_wei=%s', request, gas_price_wei)
 
             result = await self._cancel_transaction(request, gas_price_wei)
             if result.error_type == ErrorType.NO_ERROR:
@@ -315,71 +346,98 @@ class DexCommon(ABC):
     @abstractmethod
     async def _cancel_all(self, path, params: schemas.CancelAllParams, received_at_ms):
         try:
-            assert params['request_type'] == 'ORDER' or params['request_type'] == 'TRANSFER' \
-                   or params['request_type'] == 'APPROVE' or params['request_type'] == 'WRAP_UNWRAP', \
-                'Unknown transaction type'
+            assert params['request_type'] in self._CANCEL_ALL_REQUEST_TYPES, 'Unknown transaction type'
             request_type = RequestType[params['request_type']]
 
-            self._logger.debug(f'Canceling all requests, request_type={request_type.name}')
-
-            cancel_requested = []
-            failed_cancels = []
-
-            for request in self._request_cache.get_all(request_type):
-                try:
-                    gas_price_wei = self._get_gas_price(request, priority_fee=PriorityFee.Fast)
-
-                    if request.request_status == RequestStatus.CANCEL_REQUESTED:
-                        if gas_price_wei is None:
-                            self._logger.info(
-                                f'Not sending cancel request for client_request_id={request.client_request_id}'
-                                f' as cancel already in progress')
-                            cancel_requested.append(request.client_request_id)
-                            continue
-                        elif request.used_gas_prices_wei[-1] >= gas_price_wei:
-                            self._logger.info(
-                                f'Not sending cancel request for client_request_id={request.client_request_id} '
-                                f'as cancel with greater than or equal to the gas_price_wei={gas_price_wei} already in progress')
-                            cancel_requested.append(request.client_request_id)
-                            continue
-
-                    if gas_price_wei and len(request.used_gas_prices_wei) > 0:
-                        gas_price_wei = max(gas_price_wei, int(1.1 * request.used_gas_prices_wei[-1]))
-
-                    ok, reason = self._check_max_allowed_gas_price(gas_price_wei)
-                    if not ok:
-                        self._logger.error(
-                            f'Not sending cancel request for client_request_id={request.client_request_id}: {reason}')
-                        failed_cancels.append(request.client_request_id)
-                        continue
-
-                    self._logger.debug(f'Canceling={request}, gas_price_wei={gas_price_wei}')
-                    result = await self._cancel_transaction(request, gas_price_wei)
-
-                    if result.error_type == ErrorType.NO_ERROR:
-                        request.request_status = RequestStatus.CANCEL_REQUESTED
-                        if result.tx_hash:
-                            request.tx_hashes.append((result.tx_hash, RequestType.CANCEL.name))
-                            request.used_gas_prices_wei.append(gas_price_wei)
-                            self._transactions_status_poller.add_for_polling(
-                                result.tx_hash, request.client_request_id, RequestType.CANCEL)
-                        if result.pending_task:
-                            await result.pending_task
-
-                        cancel_requested.append(request.client_request_id)
-                        self._request_cache.maybe_add_or_update_request_in_redis(request.client_request_id)
-                    else:
-                        failed_cancels.append(request.client_request_id)
-                except Exception as ex:
-                    self._logger.exception(f'Failed to cancel request={request.client_request_id}: %r', ex)
-                    failed_cancels.append(request.client_request_id)
-            return 400 if failed_cancels else 200, {'cancel_requested': cancel_requested,
-                                                    'failed_cancels': failed_cancels}
+            self._logger.debug('Canceling all requests, request_type=%s', request_type.name)
+
+            return await self._cancel_open_requests(self._request_cache.get_all(request_type))
 
         except Exception as e:
             self._logger.exception(f'Failed to cancel all: %r', e)
             return 400, {'error': {'message': str(e)}}
 
+    async def _cancel_open_requests(self, requests: list):
+        """
+        Cancels `requests` for `_cancel_all` and returns its response.
+        Cancels for different requests are independent, so they are all sent concurrently.
+        """
+        cancelled = await asyncio.gather(*[self._cancel_open_request(request) for request in requests])
+
+        cancel_requested = []
+        failed_cancels = []
+        for request, ok in zip(requests, cancelled):
+            if ok is None:
+                continue
+            if ok:
+                cancel_requested.append(request.client_request_id)
+            else:
+                failed_cancels.append(request.client_request_id)
+        return 400 if failed_cancels else 200, {'cancel_requested': cancel_requested,
+                                                'failed_cancels': failed_cancels}
+
+    def _can_cancel(self, request) -> bool:
+        """
+        Whether `_cancel_all` should send a cancel for an open request, skipped requests are left out of its response.
+        """
+        return True
+
+    async def _cancel_open_request(self, request) -> Optional[bool]:
+        """
+        Cancels an open request for `_cancel_all`.
+        Returns True if a cancel was sent or is already in progress, False if it failed and None if it was skipped.
+        """
+        try:
+            if not self._can_cancel(request):
+                return None
+
+            # the gas price source can depend on the request (e.g. mainnet vs subnet on Dexalot), so it is
+            # looked up per request rather than once per batch
+            gas_price_wei = self._get_gas_price(request, priority_fee=PriorityFee.Fast)
+
+            if request.request_status == RequestStatus.CANCEL_REQUESTED:
+                if gas_price_wei is None:
+                    self._logger.info(
+                        f'Not sending cancel request for client_request_id={request.client_request_id}'
+                        f' as cancel already in progress')
+                    return True
+                elif request.used_gas_prices_wei[-1] >= gas_price_wei:
+                    self._logger.info(
+                        f'Not sending cancel request for client_request_id={request.client_request_id} '
+                        f'as cancel with greater than or equal to the gas_price_wei={gas_price_wei} already in progress')
+                    return True
+
+            if gas_price_wei and len(request.used_gas_prices_wei) > 0:
+                gas_price_wei = max(gas_price_wei, int(1.1 * request.used_gas_prices_wei[-1]))
+
+            ok, reason = self._check_max_allowed_gas_price(gas_price_wei)
+            if not ok:
+                self._logger.error(
+                    f'Not sending cancel request for client_request_id={request.client_request_id}: {reason}')
+                return False
+
+            self._logger.debug('Canceling=%s, gas_price_wei=%s', request, gas_price_wei)
+            async with self._cancel_all_semaphore:
+                result = await self._cancel_transaction(request, gas_price_wei)
+
+            if result.error_type == ErrorType.NO_ERROR:
+                request.request_status = RequestStatus.CANCEL_REQUESTED
+                if result.tx_hash:
+                    request.tx_hashes.append((result.tx_hash, RequestType.CANCEL.name))
+                    request.used_gas_prices_wei.append(gas_price_wei)
+                    self._transactions_status_poller.add_for_polling(
+                        result.tx_hash, request.client_request_id, RequestType.CANCEL)
+                if result.pending_task:
+                    await result.pending_task
+
+                self._request_cache.maybe_add_or_update_request_in_redis(request.client_request_id)
+                return True
+            else:
+                return False
+        except Exception as ex:
+            self._logger.exception(f'Failed to cancel request={request.client_request_id}: %r', ex)
+            return False
+
     async def __approve_token(self, path, params, received_at_ms):
         client_request_id = ''
         try:
@@ -401,7 +459,7 @@ class DexCommon(ABC):
                                      dex_specific={
                                          'dex': params.get('dex')
                                      })
-            self._logger.debug(f'Approving={request}, gas_price_wei={gas_price_wei}')
+            self._logger.debug('Approving=%s, gas_price_wei=%s', request, gas_price_wei)
 
             self._request_cache.add(request)
 
@@ -453,7 +511,7 @@ class DexCommon(ABC):
                                        dex_specific={
                                            'dex': params.get('dex')
                                        })
-            self._logger.debug(f'Transferring={transfer}, request_path={path}, gas_price_wei={gas_price_wei}')
+            self._logger.debug('Transferring=%s, request_path=%s, gas_price_wei=%s', transfer, path, gas_price_wei)
 
             self._request_cache.add(transfer)
 
@@ -493,7 +551,7 @@ class DexCommon(ABC):
                 if not ok:
                     return 400, {'error': {'message': reason}}
 
-                self._logger.debug(f'Amending={request}, gas_price_wei={gas_price_wei}')
+                self._logger.debug('Amending=%s, gas_price_wei=%s', request, gas_price_wei)
                 result = await self._amend_transaction(request, params, gas_price_wei)
 
                 if result.error_type == ErrorType.NO_ERROR:
@@ -516,13 +574,15 @@ class DexCommon(ABC):
             return 400, {'error': {'message': repr(e)}}
 
     def _allow_withdraw(self, client_request_id, symbol, address_to):
-        if symbol not in self._withdrawal_address_whitelists:
+        # .get() rather than [] as the whitelists are defaultdicts and looking up an unknown token must not add it
+        withdrawal_addresses = self._withdrawal_address_whitelists.get(symbol)
+        if withdrawal_addresses is None:
             self._logger.error(
                 f'HIGH ALERT: client_request_id={client_request_id} tried to withdraw unknown token={symbol}')
             return False, f'Unknown token={symbol}'
 
         assert address_to is not None
-        if Web3.to_checksum_address(address_to) not in self._withdrawal_address_whitelists[symbol]:
+        if Web3.to_checksum_address(address_to) not in withdrawal_addresses:
             self._logger.error(
                 f'HIGH ALERT: client_request_id={client_request_id} tried to withdraw token={symbol} '
                 f'to unknown address={address_to}')
@@ -1,9 +1,11 @@
+import asyncio
+import heapq
 import json
 import logging
 import time
-from collections import deque
+from collections import defaultdict, deque
 from datetime import timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from pantheon import Pantheon
 from pyutils.exchange_apis.dex_common import (
@@ -19,6 +21,14 @@ from utils.redis_batch_executor import RedisBatchExecutor
 
 from .transactions_status_poller import TransactionsStatusPoller
 
+# persisted request_type name -> Request subclass able to restore it
+_REQUEST_CLASS_BY_TYPE_NAME = {
+    RequestType.ORDER.name: OrderRequest,
+    RequestType.TRANSFER.name: TransferRequest,
+    RequestType.APPROVE.name: ApproveRequest,
+    RequestType.WRAP_UNWRAP.name: WrapUnwrapRequest,
+}
+
 
 class RequestsCache:
     def __init__(self, pantheon: Pantheon, config, dex):
@@ -26,6 +36,14 @@ class RequestsCache:
         self.__dex = dex
         self.pantheon = pantheon
         self.__requests: Dict[str, Request] = {}
+        # client_request_id -> request for requests which are not finalised yet, in insertion order
+        self.__open_requests: Dict[str, Request] = {}
+        # request_type -> client_request_id -> request, for requests which are not finalised yet
+        self.__open_requests_by_type: Dict[RequestType, Dict[str, Request]] = defaultdict(dict)
+        # min-heap of (delete_at_ms, client_request_id) for finalised requests, so cleanup only visits expired ones
+        self.__finalised_requests_heap: List[Tuple[int, str]] = []
+        self.__transactions_status_poller: Optional[TransactionsStatusPoller] = None
+        self.__tasks = []
         self.__redis = None
         self.__redis_batch_executor = None
         self.__redis_request_key = pantheon.process_name + '.requests'
@@ -39,34 +57,44 @@ class RequestsCache:
         self.__store_in_redis: bool = config.get("store_in_redis", True)
 
     async def start(self, transactions_status_poller: TransactionsStatusPoller):
+        self.__transactions_status_poller = transactions_status_poller
         if self.__store_in_redis:
             self.__redis = self.pantheon.get_aioredis_connection()
             self.__redis_batch_executor = RedisBatchExecutor(self.pantheon, self.__logger, self.__redis,
                                                              write_interval=timedelta(seconds=5), write_callback=None)
 
             await self.__load_requests(transactions_status_poller)
-            self.pantheon.spawn(self.__retry_failed_add_in_redis())
+            self.__tasks.append(self.pantheon.spawn(self.__retry_failed_add_in_redis()))
 
-        self.pantheon.spawn(self.__finalised_requests_cleanup())
+        self.__tasks.append(self.pantheon.spawn(self.__finalised_requests_cleanup()))
         if self.__pending_order_cleanup_after_s or self.__pending_transfer_cleanup_after_s:
-            self.pantheon.spawn(self.__pending_requests_cleanup())
+            self.__tasks.append(self.pantheon.spawn(self.__pending_requests_cleanup()))
+
+    async def stop(self):
+        for task in self.__tasks:
+            task.cancel()
+        await asyncio.gather(*self.__tasks, return_exceptions=True)
+        self.__tasks.clear()
 
     def add(self, request: Request):
         if request.client_request_id in self.__requests:
             raise RuntimeError(
                 f'{request.client_request_id} already exists in request cache')
         self.__requests[request.client_request_id] = request
+        self.__add_to_open(request)
         self.maybe_add_or_update_request_in_redis(request.client_request_id)
 
     def get(self, client_request_id: str) -> Optional[Request]:
         return self.__requests.get(client_request_id, None)
 
     def get_all(self, request_type: RequestType = None) -> List[Request]:
-        requests_list = []
-        for request in self.__requests.values():
-            if (not request.is_finalised()) and (request_type == None or request.request_type == request_type):
-                requests_list.append(request)
-        return requests_list
+        if request_type is None:
+            open_requests = self.__open_requests
+        else:
+            open_requests = self.__open_requests_by_type.get(request_type, {})
+        # requests finalised without going through finalise_request are only dropped from the open index by
+        # the cleanup coroutine, so filter them out here
+        return [request for request in open_requests.values() if not request.is_finalised()]
 
     def get_max_nonce(self, request_filter=None) -> int:
         if request_filter is not None:
@@ -79,11 +107,29 @@ class RequestsCache:
         request = self.get(client_request_id)
         if request:
             request.finalise_request(request_status)
+            self.__remove_from_open(request)
+            self.__schedule_delete(request)
+            # none of the request's transactions can change its status any more
+            if self.__transactions_status_poller is not None:
+                self.__transactions_status_poller.remove_from_polling(tx_hash for tx_hash, _ in request.tx_hashes)
             self.maybe_add_or_update_request_in_redis(client_request_id)
         else:
             self.__logger.error(
                 f'Not finalising request with client_request_id={client_request_id} as not found')
 
+    def __add_to_open(self, request: Request):
+        self.__open_requests[request.client_request_id] = request
+        self.__open_requests_by_type[request.request_type][request.client_request_id] = request
+
+    def __remove_from_open(self, request: Request):
+        self.__open_requests.pop(request.client_request_id, None)
+        self.__open_requests_by_type.get(request.request_type, {}).pop(request.client_request_id, None)
+
+    def __schedule_delete(self, request: Request):
+        heapq.heappush(self.__finalised_requests_heap,
+                       (request.finalised_at_ms + self.__finalised_requests_cleanup_after_s * 1000,
+                        request.client_request_id))
+
     def maybe_add_or_update_request_in_redis(self, client_request_id: str):
         if not self.__store_in_redis:
             return
@@ -107,7 +153,8 @@ class RequestsCache:
                 self.__redis_batch_executor.execute(
                     'HDEL', self.__redis_request_key, client_request_id)
 
-            self.__requests.pop(client_request_id)
+            request = self.__requests.pop(client_request_id)
+            self.__remove_from_open(request)
         except Exception as ex:
             self.__logger.exception(
                 f'Failed to delete client_request_id={client_request_id} from cache: %r', ex)
@@ -116,7 +163,7 @@ class RequestsCache:
         self.__logger.info(
             f'Loading requests from redis: {self.__redis_request_key}')
 
-        start = time.time()
+        start = time.monotonic()
         requests_dict = {}
 
         while True:
@@ -131,21 +178,18 @@ class RequestsCache:
 
         for request_str in requests_dict.values():
             try:
-                self.__logger.debug(f'Loading request {request_str}')
+                self.__logger.debug('Loading request %s', request_str)
                 request_json = json.loads(request_str)
-                if request_json['request_type'] == RequestType.ORDER.name:
-                    request = OrderRequest.from_json(request_json)
-                elif request_json['request_type'] == RequestType.TRANSFER.name:
-                    request = TransferRequest.from_json(request_json)
-                elif request_json['request_type'] == RequestType.APPROVE.name:
-                    request = ApproveRequest.from_json(request_json)
-                elif request_json['request_type'] == RequestType.WRAP_UNWRAP.name:
-                    request = WrapUnwrapRequest.from_json(request_json)
-                else:
-                    assert False
+                request_class = _REQUEST_CLASS_BY_TYPE_NAME.get(request_json['request_type'])
+                assert request_class is not None
+                request = request_class.from_json(request_json)
 
                 if request.nonce:
                     self.__requests[request.client_request_id] = request
+                    if request.is_finalised():
+                        self.__schedule_delete(request)
+                    else:
+                        self.__add_to_open(request)
                     for tx_hash, request_type in request.tx_hashes:
                         if tx_hash is not None:
                             transactions_status_poller.add_for_polling(tx_hash,
@@ -157,19 +201,40 @@ class RequestsCache:
                     "Error loading request from redis, err: %r, skipping:'%s'", e, request_str)
 
         self.__logger.info("Loaded %d requests from redis in %dms", len(
-            self.__requests), round((time.time() - start) * 1000))
+            self.__requests), round((time.monotonic() - start) * 1000))
 
     async def __finalised_requests_cleanup(self):
         self.__logger.debug(
             f'Starting poller for clearing up requests finalised {self.__finalised_requests_cleanup_after_s}s earlier')
 
+        heap = self.__finalised_requests_heap
         while True:
             self.__logger.debug('Polling for finalised requests cleanup')
-            for request in list(self.__requests.values()):
-                if self.__can_delete_request_now(request):
-                    self.__delete_request(request.client_request_id)
-
-            await self.pantheon.sleep(25)
+            now_ms = int(time.time() * 1000)
+            self.__prune_open_requests()
+            while heap and heap[0][0] < now_ms:
+                _, client_request_id = heapq.heappop(heap)
+                request = self.get(client_request_id)
+                if request is None:
+                    # already deleted, e.g. the request was scheduled more than once
+                    continue
+                if self.__can_delete_request_now(request, now_ms):
+                    self.__delete_request(client_request_id)
+                elif request.is_finalised():
+                    self.__schedule_delete(request)
+
+            # requests finalised from now on expire after everything already in the heap, but keep a 25s tick so
+            # requests finalised outside finalise_request are still pruned from the open index
+            next_expiry_s = (heap[0][0] - now_ms) / 1000 if heap else 25
+            await self.pantheon.sleep(min(25, max(1, next_expiry_s)))
+
+    def __prune_open_requests(self):
+        # requests are normally dropped from the open index on finalisation, this only catches requests
+        # finalised without going through finalise_request
+        finalised = [request for request in self.__open_requests.values() if request.is_finalised()]
+        for request in finalised:
+            self.__remove_from_open(request)
+            self.__schedule_delete(request)
 
     async def __pending_requests_cleanup(self):
         self.__logger.debug(
@@ -180,8 +245,9 @@ class RequestsCache:
         while True:
             self.__logger.debug('Polling for pending requests')
             try:
+                now_ms = int(time.time() * 1000)
                 for request in self.get_all():
-                    if self.__can_finalize_pending_request_now(request):
+                    if self.__can_finalize_pending_request_now(request, now_ms):
                         await self.__dex.on_request_status_update(request.client_request_id, RequestStatus.FAILED, None)
             except Exception as e:
                 self.__logger.exception(f"Error finalising pending requests {e}")
@@ -196,23 +262,22 @@ class RequestsCache:
             self.__logger.debug('Polling to retry adding requests in redis')
             temp = self.__pending_add_in_redis
             self.__pending_add_in_redis = deque()
+            now_ms = int(time.time() * 1000)
             while len(temp) > 0:
                 client_request_id = temp.pop()
                 request = self.get(client_request_id)
-                if request and not self.__can_delete_request_now(request):
+                if request and not self.__can_delete_request_now(request, now_ms):
                     self.maybe_add_or_update_request_in_redis(client_request_id)
 
             await self.pantheon.sleep(10)
 
-    def __can_finalize_pending_request_now(self, request: Request):
-        now_ms = int(time.time() * 1000)
+    def __can_finalize_pending_request_now(self, request: Request, now_ms: int):
         deadline_time_s = self.__pending_order_cleanup_after_s if request.request_type == RequestType.ORDER else self.__pending_transfer_cleanup_after_s
         if request.received_at_ms + deadline_time_s * 1000 < now_ms:
             return True
         return False
 
-    def __can_delete_request_now(self, request: Request):
-        now_ms = int(time.time() * 1000)
+    def __can_delete_request_now(self, request: Request, now_ms: int):
         if request.is_finalised() and \
                 request.finalised_at_ms + self.__finalised_requests_cleanup_after_s * 1000 < now_ms:
             return True
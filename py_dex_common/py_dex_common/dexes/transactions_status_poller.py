@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import time
 
 from pantheon import Pantheon
 from pyutils.exchange_apis.dex_common import Request, RequestType, RequestStatus
@@ -7,87 +8,157 @@ from pyutils.exchange_apis.dex_common import Request, RequestType, RequestStatus
 from web3.exceptions import TransactionNotFound
 
 
+class _PolledTx:
+    __slots__ = ("client_request_id", "request_type", "next_poll_at", "poll_delay_s")
+
+    def __init__(self, client_request_id: str, request_type: RequestType, poll_delay_s: float):
+        self.client_request_id = client_request_id
+        self.request_type = request_type
+        self.next_poll_at = 0
+        self.poll_delay_s = poll_delay_s
+
+
 class TransactionsStatusPoller:
     def __init__(self, pantheon: Pantheon, config, dex):
         self.pantheon = pantheon
         self.__dex = dex
         self.__logger = logging.getLogger("transactions_status_poller")
 
-        self.__tx_hash_to_request_id_and_type = {}
+        self.__tx_hash_to_polled_tx = {}
+        self.__tasks = []
         self.__poll_interval_s = config["poll_interval_s"]
         self.__periodically_poll_for_tx_receipt = config.get("periodically_poll_for_tx_receipt", True)
+        # While a push subscription (e.g. WS for mined transactions) is delivering status updates, periodic polling
+        # only reconciles updates the subscription might have missed, so it runs at this much longer interval
+        self.__reconcile_interval_s = config.get("reconcile_interval_s", 30)
+        # Transactions added while the push subscription is healthy are not polled before this grace period, so
+        # reconciliation does not race the push update of a transaction which just got mined
+        self.__push_update_grace_s = config.get("push_update_grace_s", 5)
+        self.__push_updates_healthy = False
+        # Transactions rarely get mined right after submission and ones pending for long are unlikely to be mined on
+        # the next poll either, so each transaction backs off from poll_interval_s up to max_poll_interval_s
+        # between receipt misses
+        self.__max_poll_interval_s = config.get("max_poll_interval_s", 15)
 
     async def start(self):
-        self.pantheon.spawn(self.__poll_tx_for_status())
+        self.__tasks.append(self.pantheon.spawn(self.__poll_tx_for_status()))
+
+    async def stop(self):
+        for task in self.__tasks:
+            task.cancel()
+        await asyncio.gather(*self.__tasks, return_exceptions=True)
+        self.__tasks.clear()
 
     def add_for_polling(self, tx_hash: str, client_request_id: str, request_type: RequestType):
-        self.__tx_hash_to_request_id_and_type[tx_hash] = (client_request_id, request_type)
+        polled_tx = _PolledTx(client_request_id, request_type, self.__poll_interval_s)
+        if self.__push_updates_healthy:
+            polled_tx.next_poll_at = time.monotonic() + self.__push_update_grace_s
+        self.__tx_hash_to_polled_tx[tx_hash] = polled_tx
+
+    def remove_from_polling(self, tx_hashes):
+        for tx_hash in tx_hashes:
+            self.__tx_hash_to_polled_tx.pop(tx_hash, None)
+
+    def set_push_updates_healthy(self, healthy: bool):
+        if healthy != self.__push_updates_healthy:
+            self.__logger.info(f"Push updates healthy={healthy}, periodic polling every "
+                               f"{self.__reconcile_interval_s if healthy else self.__poll_interval_s}s")
+        self.__push_updates_healthy = healthy
 
     async def poll_for_status(self, tx_hashes: list):
-        tx_hash_to_request_id_and_type = {}
+        tx_hash_to_polled_tx = {}
         for tx_hash in tx_hashes:
-            if tx_hash in self.__tx_hash_to_request_id_and_type:
-                tx_hash_to_request_id_and_type[tx_hash] = self.__tx_hash_to_request_id_and_type[tx_hash]
+            polled_tx = self.__tx_hash_to_polled_tx.get(tx_hash)
+            if polled_tx is not None:
+                tx_hash_to_polled_tx[tx_hash] = polled_tx
             else:
                 self.__logger.info(f"No request found for the tx_hash={tx_hash}")
 
-        await self.__poll_tx(tx_hash_to_request_id_and_type)
+        await self.__poll_tx(tx_hash_to_polled_tx)
 
     async def __poll_tx_for_status(self):
-        self.__logger.debug(f"Start polling for transaction status every {self.__poll_interval_s}s")
+        self.__logger.debug("Start polling for transaction status every %ss", self.__poll_interval_s)
 
+        last_polled_at = 0
         while True:
-            self.__logger.debug("Polling status for transactions")
-            await self.__poll_tx(self.__tx_hash_to_request_id_and_type, self.__periodically_poll_for_tx_receipt)
+            now = time.monotonic()
+            if not self.__push_updates_healthy or now - last_polled_at >= self.__reconcile_interval_s:
+                tx_hash_to_polled_tx = self.__get_tx_hashes_due_for_polling(now)
+                if tx_hash_to_polled_tx:
+                    self.__logger.debug("Polling status for transactions")
+                    await self.__poll_tx(tx_hash_to_polled_tx, self.__periodically_poll_for_tx_receipt)
+                last_polled_at = now
             await self.pantheon.sleep(self.__poll_interval_s)
 
-    async def __poll_tx(self, tx_hash_to_request_id_and_type: dict, get_receipt=True):
-        tasks = []
+    def __get_tx_hashes_due_for_polling(self, now: float) -> dict:
+        if not self.__tx_hash_to_polled_tx:
+            return {}
+        return {tx_hash: polled_tx for tx_hash, polled_tx in self.__tx_hash_to_polled_tx.items()
+                if polled_tx.next_poll_at <= now}
+
+    def __back_off(self, polled_tx: _PolledTx):
+        polled_tx.next_poll_at = time.monotonic() + polled_tx.poll_delay_s
+        polled_tx.poll_delay_s = min(polled_tx.poll_delay_s * 1.5, self.__max_poll_interval_s)
 
-        for tx_hash in list(tx_hash_to_request_id_and_type.keys()):
-            self.__logger.debug(f"Polling tx_hash {tx_hash}")
+    async def __poll_tx(self, tx_hash_to_polled_tx: dict, get_receipt=True):
+        if not tx_hash_to_polled_tx:
+            return
 
-            val = tx_hash_to_request_id_and_type.get(tx_hash)
-            if val is None:
+        tx_hash_to_request = {}
+        tx_hash_to_polled_tx_to_poll = {}
+
+        stopped_tx_hashes = []
+        debug_enabled = self.__logger.isEnabledFor(logging.DEBUG)
+        for tx_hash, polled_tx in tx_hash_to_polled_tx.items():
+            if debug_enabled:
+                self.__logger.debug("Polling tx_hash %s", tx_hash)
+
+            request: Request = self.__dex.get_request(polled_tx.client_request_id)
+            if request is None or request.is_finalised():
+                stopped_tx_hashes.append(tx_hash)
                 continue
 
-            client_request_id, request_type = val
-            tasks.append(self.__poll_tx_hash(tx_hash, client_request_id, request_type, get_receipt))
+            tx_hash_to_request[tx_hash] = request
+            tx_hash_to_polled_tx_to_poll[tx_hash] = polled_tx
 
-            # To avoid issues like:
-            # socket.accept() out of system resource
-            # SSLError(OSError(24, 'Too many open files'))
-            #
-            # TODO: maybe increase system resources and not add this check
-            if len(tasks) >= 50:
-                await asyncio.gather(*tasks)
-                tasks = []
+        for tx_hash in stopped_tx_hashes:
+            self.__tx_hash_to_polled_tx.pop(tx_hash, None)
 
-        if len(tasks) > 0:
-            await asyncio.gather(*tasks)
+        if not get_receipt or len(tx_hash_to_request) == 0:
+            return
 
-    async def __poll_tx_hash(self, tx_hash: str, client_request_id: str, request_type: RequestType, get_receipt: bool):
-        try:
-            request: Request = self.__dex.get_request(client_request_id)
+        # Receipts of all pending transactions are fetched concurrently through the dex's overridable batching hook
+        tx_hash_to_receipt = await self.__dex.get_transaction_receipts(tx_hash_to_request)
 
-            if request is None or request.is_finalised():
-                self.__tx_hash_to_request_id_and_type.pop(tx_hash, None)
-                return
+        tasks = []
+        for tx_hash, receipt in tx_hash_to_receipt.items():
+            tasks.append(self.__on_tx_receipt(tx_hash, tx_hash_to_polled_tx_to_poll[tx_hash],
+                                              tx_hash_to_request[tx_hash], receipt))
 
-            if not get_receipt:
-                return
+        if len(tasks) > 0:
+            await asyncio.gather(*tasks)
 
-            receipt = await self.__dex.get_transaction_receipt(request, tx_hash)
+    async def __on_tx_receipt(self, tx_hash: str, polled_tx: _PolledTx, request: Request, receipt):
+        client_request_id = polled_tx.client_request_id
+        request_type = polled_tx.request_type
+        try:
+            if isinstance(receipt, Exception):
+                raise receipt
+            if isinstance(receipt, BaseException):
+                # gather(return_exceptions=True) also returns a CancelledError from a receipt fetch, which is not
+                # an Exception; back off and retry it like any other failed fetch
+                raise RuntimeError(f'Fetching receipt failed: {receipt!r}') from receipt
 
             # request might be finalised while we were waiting for its transaction_receipt
-            if request is None or request.is_finalised():
-                self.__tx_hash_to_request_id_and_type.pop(tx_hash, None)
+            if request.is_finalised():
+                self.__tx_hash_to_polled_tx.pop(tx_hash, None)
                 return
 
             if receipt is None:
+                self.__back_off(polled_tx)
                 return
 
-            self.__logger.debug(f"Polled receipt of tx_hash {tx_hash}: {receipt}")
+            self.__logger.debug("Polled receipt of tx_hash %s: %s", tx_hash, receipt)
 
             # No need to check receipt['status'] in case of RequestType.CANCEL because
             # it doesn't matter whether the transaction which was used to cancel the original
@@ -105,6 +176,7 @@ class TransactionsStatusPoller:
             await self.__dex.on_request_status_update(client_request_id, request_status, receipt, tx_hash)
 
         except Exception as e:
+            self.__back_off(polled_tx)
             if not isinstance(e, TransactionNotFound):
                 self.__logger.exception(
                     f"Error polling tx_hash: {tx_hash} for client_request_id={client_request_id}, " f"request_type={request_type}: %r", e
@@ -0,0 +1,45 @@
+import asyncio
+import logging
+from collections import deque
+
+_logger = logging.getLogger(__name__)
+
+
+class WsMessageBuffer:
+    """
+    Hands WS messages from the api subscription (single producer) to the receiving coroutine (single consumer)
+    with a deque and an event, which is cheaper per message than an asyncio.Queue.
+    Implements the put/put_nowait part of the asyncio.Queue interface expected by the api.
+    The buffer is bounded: put waits for the consumer to make room, put_nowait drops the oldest message since
+    a missed mined-tx notification is still picked up by the periodic receipt polling.
+    """
+
+    def __init__(self, maxsize: int):
+        self.__messages = deque(maxlen=maxsize)
+        self.__has_messages = asyncio.Event()
+        self.__has_space = asyncio.Event()
+        self.__has_space.set()
+
+    def put_nowait(self, message):
+        if len(self.__messages) == self.__messages.maxlen:
+            _logger.warning('WS message buffer full (%d), dropping oldest message', self.__messages.maxlen)
+        self.__messages.append(message)
+        self.__has_messages.set()
+
+    async def put(self, message):
+        while len(self.__messages) == self.__messages.maxlen:
+            self.__has_space.clear()
+            await self.__has_space.wait()
+        self.put_nowait(message)
+
+    async def wait(self):
+        await self.__has_messages.wait()
+        self.__has_messages.clear()
+
+    def __len__(self):
+        return len(self.__messages)
+
+    def popleft(self):
+        message = self.__messages.popleft()
+        self.__has_space.set()
+        return message
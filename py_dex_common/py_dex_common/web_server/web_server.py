@@ -78,9 +78,9 @@ class WebServer:
                 try:
                     request_id = self.__get_next_request_id()
                     received_at_ms = int(time.time() * 1000)
-                    _logger.debug(f'oapi [{request_id}] received_at_ms={received_at_ms}, path={path}, params={params}')
+                    _logger.debug('oapi [%s] received_at_ms=%s, path=%s, params=%s', request_id, received_at_ms, path, params)
                     status, data = await handler(path, params, received_at_ms)
-                    _logger.debug(f'[{request_id}] status={status}, data={data}')
+                    _logger.debug('[%s] status=%s, data=%s', request_id, status, data)
 
                     if status != 200:
                         if isinstance(data, BaseModel):
@@ -140,9 +140,8 @@ class WebServer:
                     else:
                         params = dict(request.query)
                     _logger.debug(
-                        f'[{request_id}] received_at_ms={received_at_ms}, '
-                        f'remote={request.remote}, method={request.method}, '
-                        f'path={request.path}, params={params}'
+                        '[%s] received_at_ms=%s, remote=%s, method=%s, path=%s, params=%s',
+                        request_id, received_at_ms, request.remote, request.method, request.path, params
                     )
                 except Exception as e:
                     _logger.error(
@@ -208,12 +207,24 @@ class WebServer:
                 return
             await self.__send(ws, msg)
 
+    async def send_str(self, ws, data: str):
+        # data is an already serialised JSON payload, so a message fanned out
+        # to several clients is only encoded once
+        if ws not in self.__connections:
+            return
+        try:
+            _logger.debug('Sending %s', data)
+            await ws.send_str(data)
+        except Exception:
+            _logger.exception('Could not send %s', data)
+            await ws.close()
+
     async def __send(self, ws, msg):
         try:
-            _logger.debug(f'Sending {msg}')
+            _logger.debug('Sending %s', msg)
             await ws.send_json(msg)
         except Exception:
-            _logger.exception(f'Could not send {msg}')
+            _logger.exception('Could not send %s', msg)
             await ws.close()
 
     async def __on_shutdown(self, app):
@@ -230,7 +241,7 @@ class WebServer:
         while True:
             try:
                 msg = await receive_json(ws)
-                _logger.debug(f'Received {msg}')
+                _logger.debug('Received %s', msg)
                 await self.__proxy.on_message(ws, msg)
             except concurrent.futures.CancelledError:
                 pass
@@ -0,0 +1,10 @@
+import sys
+from pathlib import Path
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+ROOT = PACKAGE_ROOT.parent
+
+# import the py_dex_common package itself rather than the repository level wrapper of the same name
+sys.path.insert(0, str(PACKAGE_ROOT))
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
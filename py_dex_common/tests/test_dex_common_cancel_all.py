@@ -0,0 +1,148 @@
+import asyncio
+
+from pyutils.exchange_apis.dex_common import ErrorType, RequestStatus, RequestType
+from py_dex_common.dexes.dex_common import DexCommon
+
+
+class _Server:
+    def register(self, *args, **kwargs):
+        pass
+
+
+class _Pantheon:
+    process_name = 'cancel-all-test'
+
+
+class _Request:
+    def __init__(self, client_request_id):
+        self.client_request_id = client_request_id
+        self.request_type = RequestType.ORDER
+        self.request_status = RequestStatus.PENDING
+        self.nonce = 1
+        self.tx_hashes = []
+        self.used_gas_prices_wei = []
+
+    def is_finalised(self):
+        return False
+
+
+class _CancelResult:
+    def __init__(self, error_type, tx_hash=None):
+        self.error_type = error_type
+        self.tx_hash = tx_hash
+        self.pending_task = None
+
+
+class _Dex(DexCommon):
+    CHANNELS = []
+
+    def __init__(self, max_concurrent_cancel_all_requests=20, failing_client_request_ids=()):
+        config = {
+            'name': 'cancel-all-test',
+            'request_cache': {'finalised_requests_cleanup_after_s': 60, 'store_in_redis': False},
+            'transactions_status_poller': {'poll_interval_s': 1},
+            'max_concurrent_cancel_all_requests': max_concurrent_cancel_all_requests,
+        }
+        super().__init__(_Pantheon(), config, _Server(), event_sink=None)
+        self.failing_client_request_ids = set(failing_client_request_ids)
+        self.gas_price_lookups = []
+        self.cancels_in_flight = 0
+        self.max_cancels_in_flight = 0
+
+    async def start(self, private_key):
+        pass
+
+    async def on_new_connection(self, ws):
+        pass
+
+    async def process_request(self, ws, request_id, method, params: dict):
+        return False
+
+    async def _approve(self, request, gas_price_wei, nonce=None):
+        pass
+
+    async def _transfer(self, request, gas_price_wei, nonce=None):
+        pass
+
+    async def _amend_transaction(self, request, params, gas_price_wei):
+        pass
+
+    async def _cancel_transaction(self, request, gas_price_wei):
+        self.cancels_in_flight += 1
+        self.max_cancels_in_flight = max(self.max_cancels_in_flight, self.cancels_in_flight)
+        await asyncio.sleep(0.01)
+        self.cancels_in_flight -= 1
+        if request.client_request_id in self.failing_client_request_ids:
+            return _CancelResult(ErrorType.TRANSACTION_FAILED)
+        return _CancelResult(ErrorType.NO_ERROR, f'0xcancel-{request.client_request_id}')
+
+    async def get_transaction_receipt(self, request, tx_hash):
+        return None
+
+    def _get_gas_price(self, request, priority_fee):
+        self.gas_price_lookups.append(request.client_request_id)
+        return 100
+
+    async def _get_all_open_requests(self, path, params, received_at_ms):
+        return await super()._get_all_open_requests(path, params, received_at_ms)
+
+    async def _cancel_all(self, path, params, received_at_ms):
+        return await super()._cancel_all(path, params, received_at_ms)
+
+    def on_request_status_update(self, client_request_id, request_status, tx_receipt, mined_tx_hash=None):
+        pass
+
+
+def _cancel_open_requests(dex, client_request_ids):
+    for client_request_id in client_request_ids:
+        dex._request_cache.add(_Request(client_request_id))
+    return asyncio.run(dex._cancel_open_requests(dex._request_cache.get_all(RequestType.ORDER)))
+
+
+def test_cancel_all_sends_cancels_concurrently():
+    dex = _Dex()
+    client_request_ids = [f'order-{i}' for i in range(5)]
+
+    status, body = _cancel_open_requests(dex, client_request_ids)
+
+    assert status == 200
+    assert body == {'cancel_requested': client_request_ids, 'failed_cancels': []}
+    assert dex.max_cancels_in_flight == 5
+    assert dex.gas_price_lookups == client_request_ids
+    for client_request_id in client_request_ids:
+        request = dex._request_cache.get(client_request_id)
+        assert request.request_status == RequestStatus.CANCEL_REQUESTED
+        assert request.tx_hashes == [(f'0xcancel-{client_request_id}', RequestType.CANCEL.name)]
+        assert request.used_gas_prices_wei == [100]
+
+
+def test_cancel_all_reports_failed_cancels_without_stopping_the_others():
+    dex = _Dex(failing_client_request_ids=['order-1'])
+
+    status, body = _cancel_open_requests(dex, ['order-0', 'order-1', 'order-2'])
+
+    assert status == 400
+    assert body == {'cancel_requested': ['order-0', 'order-2'], 'failed_cancels': ['order-1']}
+    assert dex._request_cache.get('order-1').request_status == RequestStatus.PENDING
+
+
+def test_cancel_all_skips_requests_the_dex_cannot_cancel():
+    dex = _Dex()
+    dex._can_cancel = lambda request: request.client_request_id != 'order-1'
+
+    status, body = _cancel_open_requests(dex, ['order-0', 'order-1'])
+
+    assert status == 200
+    assert body == {'cancel_requested': ['order-0'], 'failed_cancels': []}
+    assert dex.gas_price_lookups == ['order-0']
+
+
+def test_cancel_all_bounds_cancels_in_flight():
+    dex = _Dex(max_concurrent_cancel_all_requests=2)
+    client_request_ids = [f'order-{i}' for i in range(5)]
+
+    status, body = _cancel_open_requests(dex, client_request_ids)
+
+    assert status == 200
+    assert body['cancel_requested'] == client_request_ids
+    assert dex.max_cancels_in_flight == 2
@@ -0,0 +1,120 @@
+import asyncio
+import time
+
+from pyutils.exchange_apis.dex_common import RequestType
+from py_dex_common.dexes.requests_cache import RequestsCache
+
+
+class _Pantheon:
+    process_name = 'requests-cache-test'
+
+    def __init__(self):
+        self.sleeps = []
+
+    def spawn(self, coro):
+        return asyncio.ensure_future(coro)
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        await asyncio.Event().wait()
+
+
+class _Request:
+    def __init__(self, client_request_id, request_type=RequestType.ORDER, finalise_at_ms=None):
+        self.client_request_id = client_request_id
+        self.request_type = request_type
+        self.nonce = None
+        self.tx_hashes = []
+        self.finalised_at_ms = None
+        self.finalise_at_ms = finalise_at_ms
+
+    def is_finalised(self):
+        return self.finalised_at_ms is not None
+
+    def finalise_request(self, request_status):
+        self.finalised_at_ms = self.finalise_at_ms or int(time.time() * 1000)
+
+
+def _make_cache(pantheon=None, cleanup_after_s=60):
+    config = {'finalised_requests_cleanup_after_s': cleanup_after_s, 'store_in_redis': False}
+    return RequestsCache(pantheon or _Pantheon(), config, dex=None)
+
+
+def _run_cleanup_once(cache):
+    async def run():
+        await cache.start(None)
+        # let the cleanup coroutine run its first pass, it then waits in pantheon.sleep
+        await asyncio.sleep(0)
+        await cache.stop()
+
+    asyncio.run(run())
+
+
+def test_get_all_returns_open_requests_in_insertion_order():
+    cache = _make_cache()
+    order_1 = _Request('order-1')
+    transfer = _Request('transfer', RequestType.TRANSFER)
+    order_2 = _Request('order-2')
+    for request in (order_1, transfer, order_2):
+        cache.add(request)
+
+    assert cache.get_all() == [order_1, transfer, order_2]
+    assert cache.get_all(RequestType.ORDER) == [order_1, order_2]
+    assert cache.get_all(RequestType.TRANSFER) == [transfer]
+    assert cache.get_all(RequestType.APPROVE) == []
+
+
+def test_finalised_requests_are_not_open():
+    cache = _make_cache()
+    order_1 = _Request('order-1')
+    order_2 = _Request('order-2')
+    cache.add(order_1)
+    cache.add(order_2)
+
+    cache.finalise_request('order-1', None)
+
+    assert cache.get_all() == [order_2]
+    assert cache.get('order-1') is order_1
+
+
+def test_get_all_skips_requests_finalised_outside_the_cache_until_cleanup_prunes_them():
+    cache = _make_cache(cleanup_after_s=60)
+    expired = _Request('expired')
+    cache.add(expired)
+    expired.finalised_at_ms = int(time.time() * 1000) - 61_000
+
+    assert cache.get_all() == []
+    assert cache.get('expired') is expired
+
+    _run_cleanup_once(cache)
+
+    assert cache.get('expired') is None
+
+
+def test_cleanup_ticks_at_most_every_25s():
+    pantheon = _Pantheon()
+    cache = _make_cache(pantheon, cleanup_after_s=3600)
+    cache.add(_Request('order'))
+    cache.finalise_request('order', None)
+
+    _run_cleanup_once(cache)
+
+    assert pantheon.sleeps == [25]
+
+
+
+def test_cleanup_deletes_requests_past_the_cleanup_window_and_sleeps_until_the_next_one():
+    pantheon = _Pantheon()
+    cache = _make_cache(pantheon, cleanup_after_s=60)
+    now_ms = int(time.time() * 1000)
+    expired = _Request('expired', finalise_at_ms=now_ms - 61_000)
+    pending = _Request('pending', finalise_at_ms=now_ms - 40_000)
+    for request in (expired, pending):
+        cache.add(request)
+        cache.finalise_request(request.client_request_id, None)
+
+    _run_cleanup_once(cache)
+
+    assert cache.get('expired') is None
+    assert cache.get('pending') is pending
+    assert 19 <= pantheon.sleeps[0] <= 20
@@ -0,0 +1,125 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from pyutils.exchange_apis.dex_common import RequestType
+from py_dex_common.dexes import transactions_status_poller as poller_module
+from py_dex_common.dexes.transactions_status_poller import TransactionsStatusPoller
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self):
+        return self.now
+
+
+class _Pantheon:
+    """Runs the polling loop for `iterations` passes on a fake clock which each sleep advances."""
+
+    def __init__(self, clock, iterations):
+        self.clock = clock
+        self.iterations = iterations
+        self.done = asyncio.Event()
+
+    def spawn(self, coro):
+        return asyncio.ensure_future(coro)
+
+    async def sleep(self, seconds):
+        self.iterations -= 1
+        if self.iterations == 0:
+            self.done.set()
+            await asyncio.Event().wait()
+        self.clock.now += seconds
+
+
+class _Request:
+    def is_finalised(self):
+        return False
+
+
+class _Dex:
+    def __init__(self, clock, receipt=None):
+        self.clock = clock
+        self.receipt = receipt
+        self.polled_at = []
+        self.status_updates = []
+
+    def get_request(self, client_request_id):
+        return _Request()
+
+    async def get_transaction_receipts(self, tx_hash_to_request):
+        self.polled_at.append(self.clock.now)
+        return {tx_hash: self.receipt for tx_hash in tx_hash_to_request}
+
+    async def on_request_status_update(self, client_request_id, request_status, tx_receipt, mined_tx_hash=None):
+        self.status_updates.append((client_request_id, request_status))
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(poller_module, 'time', SimpleNamespace(monotonic=clock.monotonic))
+    return clock
+
+
+def _run_polling_loop(poller, pantheon):
+    async def run():
+        await poller.start()
+        await pantheon.done.wait()
+        await poller.stop()
+
+    asyncio.run(run())
+
+
+def test_reconciles_at_reconcile_interval_while_push_updates_are_healthy(clock):
+    pantheon = _Pantheon(clock, iterations=7)
+    dex = _Dex(clock)
+    poller = TransactionsStatusPoller(
+        pantheon, {'poll_interval_s': 1, 'max_poll_interval_s': 1, 'reconcile_interval_s': 3}, dex)
+    poller.add_for_polling('0x1', 'order', RequestType.ORDER)
+    poller.set_push_updates_healthy(True)
+
+    _run_polling_loop(poller, pantheon)
+
+    assert dex.polled_at == [100, 103, 106]
+
+
+def test_missing_receipts_back_off_by_half_up_to_max_poll_interval(clock):
+    pantheon = _Pantheon(clock, iterations=10)
+    dex = _Dex(clock)
+    poller = TransactionsStatusPoller(pantheon, {'poll_interval_s': 1, 'max_poll_interval_s': 3}, dex)
+    poller.add_for_polling('0x1', 'order', RequestType.ORDER)
+
+    _run_polling_loop(poller, pantheon)
+
+    # waits 1, 1.5 and 2.25s between misses, then is capped at 3s
+    assert dex.polled_at == [100, 101, 103, 106, 109]
+
+
+def test_transactions_added_while_push_updates_are_healthy_wait_out_the_grace_period(clock):
+    pantheon = _Pantheon(clock, iterations=7)
+    dex = _Dex(clock)
+    poller = TransactionsStatusPoller(
+        pantheon, {'poll_interval_s': 1, 'reconcile_interval_s': 3, 'push_update_grace_s': 5}, dex)
+    poller.set_push_updates_healthy(True)
+    poller.add_for_polling('0x1', 'order', RequestType.ORDER)
+
+    _run_polling_loop(poller, pantheon)
+
+    # the reconciliations at 100 and 103 fall within the grace period
+    assert dex.polled_at == [106]
+
+
+def test_cancelled_receipt_fetch_is_retried(clock):
+    dex = _Dex(clock, receipt=asyncio.CancelledError())
+    poller = TransactionsStatusPoller(_Pantheon(clock, iterations=1), {'poll_interval_s': 1}, dex)
+    poller.add_for_polling('0x1', 'order', RequestType.ORDER)
+
+    asyncio.run(poller.poll_for_status(['0x1']))
+    asyncio.run(poller.poll_for_status(['0x1']))
+
+    assert dex.polled_at == [100, 100]
+    assert dex.status_updates == []
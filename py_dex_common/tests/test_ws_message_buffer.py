@@ -0,0 +1,54 @@
+import asyncio
+
+from py_dex_common.dexes.ws_message_buffer import WsMessageBuffer
+
+
+def test_wait_returns_once_a_message_is_put():
+    async def run():
+        buffer = WsMessageBuffer(maxsize=1)
+        wait_task = asyncio.ensure_future(buffer.wait())
+        await asyncio.sleep(0)
+        assert not wait_task.done()
+
+        buffer.put_nowait('a')
+        await asyncio.wait_for(wait_task, 1)
+        return buffer.popleft()
+
+    assert asyncio.run(run()) == 'a'
+
+
+def test_put_nowait_drops_oldest_message_when_full():
+    async def run():
+        buffer = WsMessageBuffer(maxsize=2)
+        for message in ('a', 'b', 'c'):
+            buffer.put_nowait(message)
+        return [buffer.popleft() for _ in range(len(buffer))]
+
+    assert asyncio.run(run()) == ['b', 'c']
+
+
+def test_put_waits_for_consumer_to_make_room():
+    async def run():
+        buffer = WsMessageBuffer(maxsize=1)
+        await buffer.put('a')
+        put_task = asyncio.ensure_future(buffer.put('b'))
+        await asyncio.sleep(0)
+        assert not put_task.done()
+        assert len(buffer) == 1
+
+        assert buffer.popleft() == 'a'
+        await asyncio.wait_for(put_task, 1)
+        return buffer.popleft()
+
+    assert asyncio.run(run()) == 'b'
+
+
+def test_dropping_a_message_is_logged(caplog):
+    async def run():
+        buffer = WsMessageBuffer(maxsize=1)
+        buffer.put_nowait('a')
+        buffer.put_nowait('b')
+
+    asyncio.run(run())
+
+    assert 'WS message buffer full (1), dropping oldest message' in caplog.messages
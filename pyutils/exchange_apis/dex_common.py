@@ -1,4 +1,4 @@
-"""Minimal subset of pyutils.exchange_apis.dex_common used for Harbor tests."""
+"""Minimal subset of pyutils.exchange_apis.dex_common used for tests."""
 from __future__ import annotations
 
 from dataclasses import dataclass
@@ -7,11 +7,18 @@ from typing import Any, Dict, Iterable, List, Tuple
 
 
 class RequestStatus(str, Enum):
+    PENDING = "PENDING"
+    CANCEL_REQUESTED = "CANCEL_REQUESTED"
     SUCCEEDED = "SUCCEEDED"
     FAILED = "FAILED"
     CANCELED = "CANCELED"
 
 
+class ErrorType(Enum):
+    NO_ERROR = 0
+    TRANSACTION_FAILED = 1
+
+
 class _RequestTypeItem:
     def __init__(self, name: str) -> None:
         self.name = name
@@ -98,6 +105,7 @@ class WrapUnwrapRequest(_JsonBackedRequest):
 
 __all__ = [
     "ApproveRequest",
+    "ErrorType",
     "OrderRequest",
     "Request",
     "RequestStatus",
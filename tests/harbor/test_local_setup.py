@@ -57,6 +57,9 @@ class _DummyExchange:
     async def start(self, private_key):
         self.started_with = private_key
 
+    async def stop(self):
+        self.stopped = True
+
 
 class _DummyAppHealth:
     def running(self):  # pragma: no cover - trivial stub
@@ -179,5 +182,6 @@ def test_run_falls_back_to_signal_signal():
         assert server.started is True
         assert server.stopped is True
         assert hasattr(exchange, "started_with")
+        assert getattr(exchange, "stopped", False) is True
 
     asyncio.run(runner())
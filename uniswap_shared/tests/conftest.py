@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+
+# import the uniswap_shared package itself rather than the repository level directory of the same name
+sys.path.insert(0, str(PACKAGE_ROOT))
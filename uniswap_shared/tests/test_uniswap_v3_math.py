@@ -0,0 +1,44 @@
+from decimal import Decimal
+
+import pytest
+
+from uniswap_shared.uniswap_v3_math import decode_swap_amounts, swap_base_quote_native_amounts, swap_exec_price
+
+
+def _swap_data(amount0, amount1):
+    # Swap(sender, recipient, amount0, amount1, sqrtPriceX96, liquidity, tick) non-indexed words
+    words = (amount0, amount1, 0, 0, 0)
+    return b''.join(word.to_bytes(32, 'big', signed=True) for word in words)
+
+
+@pytest.mark.parametrize('as_hex', [True, False])
+def test_decode_swap_amounts_reads_signed_amounts(as_hex):
+    data = _swap_data(-5, 2 ** 200)
+    swap_log = {'data': '0x' + data.hex() if as_hex else data}
+
+    assert decode_swap_amounts(swap_log) == (-5, 2 ** 200)
+
+
+@pytest.mark.parametrize('token0_amount, token1_amount, is_buy', [
+    # buying base which is token1, the pool receives token0
+    (3000, -1, True),
+    # buying base which is token0, the pool receives token1
+    (-1, 3000, True),
+    # selling base which is token0
+    (1, -3000, False),
+    # selling base which is token1
+    (-3000, 1, False),
+])
+def test_swap_base_quote_native_amounts(token0_amount, token1_amount, is_buy):
+    assert swap_base_quote_native_amounts(token0_amount, token1_amount, is_buy) == (1, 3000)
+
+
+@pytest.mark.parametrize('base_ccy_amount, quote_ccy_amount, expected', [
+    ('1', '3000.123456', '3000.123456'),
+    ('0.5', '1500', '3000'),
+    # more significant digits than a float holds must not pick up rounding noise
+    ('1', '1234567891.234567', '1234567891.234567'),
+    ('100000000', '12345678912345678.912345', '123456789.12345679'),
+])
+def test_swap_exec_price_is_exact(base_ccy_amount, quote_ccy_amount, expected):
+    assert swap_exec_price(Decimal(base_ccy_amount), Decimal(quote_ccy_amount)) == Decimal(expected)
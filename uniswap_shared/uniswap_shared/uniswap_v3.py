@@ -1,8 +1,14 @@
 import asyncio
-import json
+import functools
+import random
+import sys
 import time
 import os
 from decimal import Decimal
+from pathlib import Path
+
+import orjson
+
 from pantheon import Pantheon
 from pantheon.market_data_types import Side
 from pantheon.instruments_source import InstrumentLifecycle, InstrumentsLiveSource, InstrumentUsageExchanges
@@ -14,12 +20,38 @@ from pyutils.exchange_connectors import ConnectorType
 from pyutils.gas_pricing.eth import PriorityFee
 
 from py_dex_common.dexes.dex_common import DexCommon
+from py_dex_common.dexes.ws_message_buffer import WsMessageBuffer
+
+from .uniswap_v3_math import decode_swap_amounts, swap_base_quote_native_amounts, swap_exec_price
 
 from pyutils.exchange_connectors import ConnectorFactory, ConnectorType
 from pyutils.exchange_apis import ApiFactory
 
+_CANCELLABLE_REQUEST_TYPES = frozenset((RequestType.ORDER, RequestType.TRANSFER, RequestType.APPROVE))
+_SIDE_BY_NAME = {'BUY': Side.BUY, 'SELL': Side.SELL}
+
+# lower-cased address -> checksum address, to avoid recomputing the keccak for addresses seen before
+_checksum_addresses: Dict[str, str] = {}
+
+
+def _to_checksum_address(address: str) -> str:
+    key = address.lower()
+    checksum_address = _checksum_addresses.get(key)
+    if checksum_address is None:
+        checksum_address = Web3.to_checksum_address(address)
+        _checksum_addresses[key] = checksum_address
+    return checksum_address
+
+
+@functools.lru_cache(maxsize=1024, typed=True)
+def _to_decimal(value) -> Decimal:
+    # strategies keep sending the same lot sizes, so most quantities parse to a Decimal seen before
+    return Decimal(value)
+
 
 class OrderInfo:
+    __slots__ = ('gas_price_wei', 'base_ccy_qty', 'quote_ccy_qty')
+
     def __init__(self, gas_price_wei: int, base_ccy_qty: Decimal, quote_ccy_qty: Decimal):
         self.gas_price_wei = gas_price_wei
         self.base_ccy_qty = base_ccy_qty
@@ -28,6 +60,10 @@ class OrderInfo:
 
 class UniswapV3(DexCommon):
     CHANNELS = ['ORDER']
+    _CANCEL_ALL_REQUEST_TYPES = ('ORDER', 'TRANSFER', 'APPROVE')
+
+    __WS_MIN_RETRY_DELAY_S = 2
+    __WS_MAX_RETRY_DELAY_S = 60
 
     def __init__(self, pantheon: Pantheon, config, server, event_sink, connector_type: ConnectorType):
         super().__init__(pantheon, config, server, event_sink)
@@ -35,25 +71,47 @@ class UniswapV3(DexCommon):
         api_factory = ApiFactory(ConnectorFactory(config["connectors"]))
         self._api = api_factory.create(self.pantheon, connector_type)
         
-        self.msg_queue = asyncio.Queue()
+        self.msg_queue = WsMessageBuffer(config.get('ws_msg_queue_maxsize', 10_000))
 
         self._server.register('POST', '/private/insert-order', self.__insert_order)
         self._server.register("POST", "/private/wrap-unwrap-token", self.__wrap_unwrap_token)
 
         self.__instruments: InstrumentsLiveSource = None
         self.__exchange_name = config["name"]
+        self.__instrument_id_by_symbol: Dict[str, InstrumentId] = {}
+        # symbol -> (base_ccy_symbol, quote_ccy_symbol, instrument), cleared on tokens whitelist refresh
+        self.__split_symbol_cache: Dict[str, tuple] = {}
+        self.__tasks = []
         self.__chain_name = config["chain_name"]
         self.__native_token = config["native_token"]
         self.__contract_addresses_file_path = config["resources_file_path"]
-        self.__txn_gas_limit = 10000000
+        self.__txn_gas_limit = int(config.get('txn_gas_limit', 10000000))
+        # per-symbol overrides for routes whose swap cost is known to differ from the generic limit
+        self.__txn_gas_limit_by_symbol: Dict[str, int] = {
+            symbol: int(gas_limit) for symbol, gas_limit in config.get('txn_gas_limit_by_symbol', {}).items()}
         # 0.01 GWEI usually.
         self.__base_block_gas_price = 10_000_000_000
         self.__tx_hash_to_order_info: Dict[str, OrderInfo] = {}
+        self.__amend_handlers = {
+            RequestType.ORDER: self.__amend_order,
+            RequestType.TRANSFER: self.__amend_transfer,
+            RequestType.APPROVE: self.__amend_approve,
+        }
+
+    def __instrument_id(self, symbol) -> InstrumentId:
+        instrument_id = self.__instrument_id_by_symbol.get(symbol)
+        if instrument_id is None:
+            instrument_id = InstrumentId(self.__exchange_name, symbol)
+            self.__instrument_id_by_symbol[symbol] = instrument_id
+        return instrument_id
 
     def __split_symbol_to_base_quote_ccy(self, symbol):
-        instrument = self.__instruments.get_instrument(
-            InstrumentId(self.__exchange_name, symbol))
-        return instrument.base_currency, instrument.quote_currency, instrument
+        split_symbol = self.__split_symbol_cache.get(symbol)
+        if split_symbol is None:
+            instrument = self.__instruments.get_instrument(self.__instrument_id(symbol))
+            split_symbol = (instrument.base_currency, instrument.quote_currency, instrument)
+            self.__split_symbol_cache[symbol] = split_symbol
+        return split_symbol
 
     async def __send_order_on_chain(self, request: OrderRequest, gas_price_wei: int) -> ApiResult:
         """
@@ -64,7 +122,7 @@ class UniswapV3(DexCommon):
         client_request_id = request.client_request_id
         try:
             nonce = await self._api.get_next_nonce_to_use()
-            self._logger.debug(f"Fetched Nonce :{nonce}, Client Request Id: {client_request_id}")
+            self._logger.debug("Fetched Nonce :%s, Client Request Id: %s", nonce, client_request_id)
             if side == Side.BUY:
                 result = await self._api.swap_exact_output_single(
                     token_in_symbol=quote_ccy_symbol, token_out_symbol=base_ccy_symbol,
@@ -86,29 +144,36 @@ class UniswapV3(DexCommon):
 
         return result
 
+    @staticmethod
+    def __deadline_since_epoch_s(timeout_s) -> int:
+        """
+            Swap deadline in epoch seconds, truncated after adding timeout_s so fractional timeouts still count
+        """
+        return int(time.time() + timeout_s)
+
     def __parse_params_to_order(self, params: dict, received_at_ms: int) -> OrderRequest:
         """
             Parse params to construct OrderRequest obj
         """
         client_request_id = params['client_request_id']
         symbol = params['symbol']
-        base_ccy_qty = Decimal(params['base_ccy_qty'])
-        quote_ccy_qty = Decimal(params['quote_ccy_qty'])
-        assert params['side'] == 'BUY' or params['side'] == 'SELL', 'Unknown order side'
-        side = Side.BUY if params['side'] == 'BUY' else Side.SELL
+        base_ccy_qty = _to_decimal(params['base_ccy_qty'])
+        quote_ccy_qty = _to_decimal(params['quote_ccy_qty'])
+        side = _SIDE_BY_NAME.get(params['side'])
+        if side is None:
+            raise ValueError('Unknown order side')
         fee_rate = int(params['fee_rate'])
-        gas_limit = self.__txn_gas_limit
+        gas_limit = self.__txn_gas_limit_by_symbol.get(symbol, self.__txn_gas_limit)
 
         timeout_s = None
         if 'timeout_s' in params:
-            timeout_s = int(time.time() + params['timeout_s'])
+            timeout_s = self.__deadline_since_epoch_s(params['timeout_s'])
 
         order = OrderRequest(client_request_id, symbol, base_ccy_qty,
                              quote_ccy_qty, side, fee_rate, gas_limit, timeout_s, received_at_ms)
         return order
 
     async def __insert_order(self, path, params: dict, received_at_ms):
-        client_request_id = ''
         try:
             client_request_id = params['client_request_id']
             gas_price_wei = int(params['gas_price_wei'])
@@ -116,7 +181,12 @@ class UniswapV3(DexCommon):
                 return 400, {'error': {'message': f'client_request_id={client_request_id} is already known'}}
             order = self.__parse_params_to_order(params, received_at_ms)
             base_ccy_symbol, quote_ccy_symbol, instrument = self.__split_symbol_to_base_quote_ccy(order.symbol)
-            self._logger.debug(f'Inserting={order}, gas_price_wei={gas_price_wei}')
+        except Exception as e:
+            self._logger.warning('Invalid insert order params: %r', e)
+            return 400, {'error': {'message': repr(e)}}
+
+        try:
+            self._logger.debug('Inserting=%s, gas_price_wei=%s', order, gas_price_wei)
             self._request_cache.add(order)
 
             ok, reason = self._check_max_allowed_gas_price(gas_price_wei)
@@ -153,60 +223,11 @@ class UniswapV3(DexCommon):
             return 400, {'error': {'message': repr(e)}}
 
     async def _cancel_all(self, path, params, received_at_ms):
-        try:
-            assert params['request_type'] in ['ORDER', 'TRANSFER', 'APPROVE'], 'Unknown transaction type'
-            request_type = RequestType[params['request_type']]
-
-            self._logger.debug(f'Canceling all requests, request_type={request_type.name}')
+        return await super()._cancel_all(path, params, received_at_ms)
 
-            cancel_requested = []
-            failed_cancels = []
-            # TODO- Latency Improvement - use asyncio.gather()
-            for request in self._request_cache.get_all(request_type):
-                try:
-                    if request.request_status != RequestStatus.PENDING or request.nonce is None:
-                        continue
-                    gas_price_wei = self._get_gas_price(request, priority_fee=PriorityFee.Fast)
-                    if request.request_status == RequestStatus.CANCEL_REQUESTED and \
-                            request.used_gas_prices_wei[-1] >= gas_price_wei:
-                        self._logger.info(
-                            f'Not sending cancel request for client_request_id={request.client_request_id} '
-                            f'as cancel with greater than or equal to the gas_price_wei={gas_price_wei} already in progress')
-                        cancel_requested.append(request.client_request_id)
-                        continue
-
-                    if len(request.used_gas_prices_wei) > 0:
-                        gas_price_wei = max(gas_price_wei, int(1.1 * request.used_gas_prices_wei[-1]))
-
-                    ok, reason = self._check_max_allowed_gas_price(gas_price_wei)
-                    if not ok:
-                        self._logger.error(
-                            f'Not sending cancel request for client_request_id={request.client_request_id}: {reason}')
-                        failed_cancels.append(request.client_request_id)
-                        continue
-
-                    self._logger.debug(f'Canceling={request}, gas_price_wei={gas_price_wei}')
-                    result = await self._cancel_transaction(request, gas_price_wei)
-                    if result.error_type == ErrorType.NO_ERROR:
-                        request.tx_hashes.append((result.tx_hash, RequestType.CANCEL.name))
-                        request.used_gas_prices_wei.append(gas_price_wei)
-                        request.request_status = RequestStatus.CANCEL_REQUESTED
-                        self._transactions_status_poller.add_for_polling(result.tx_hash, request.client_request_id,
-                                                                         RequestType.CANCEL)
-                        self._request_cache.maybe_add_or_update_request_in_redis(request.client_request_id)
-                        cancel_requested.append(request.client_request_id)
-                    else:
-                        failed_cancels.append(request.client_request_id)
-
-                except Exception as ex:
-                    self._logger.exception(f'Failed to cancel request={request.client_request_id}: %r', ex)
-                    failed_cancels.append(request.client_request_id)
-
-            return 400 if failed_cancels else 200, {'cancel_requested': cancel_requested,
-                                                    'failed_cancels': failed_cancels}
-        except Exception as e:
-            self._logger.exception(f'Failed to cancel all: %r', e)
-            return 400, {'error': {'message': str(e)}}
+    def _can_cancel(self, request) -> bool:
+        # only requests sent on chain can be cancelled, by replacing their nonce
+        return request.request_status == RequestStatus.PENDING and request.nonce is not None
 
     async def _get_all_open_requests(self, path, params, received_at_ms):
         return await super()._get_all_open_requests(path, params, received_at_ms)
@@ -232,63 +253,67 @@ class UniswapV3(DexCommon):
         else:
             assert False
 
-    async def _amend_transaction(self, request: Request, params, gas_price_wei):
-        result: Optional[ApiResult] = None
-        if request.request_type == RequestType.ORDER:
-            if request.nonce is None:
-                self._logger.debug(f"Amend requested before setting nonce "
-                                   f"for Client Request Id".format(request.client_request_id))
+    async def __amend_order(self, request: OrderRequest, params, gas_price_wei) -> ApiResult:
+        if request.nonce is None:
+            self._logger.debug("Amend requested before setting nonce for Client Request Id: %s",
+                               request.client_request_id)
 
-                return ApiResult(error_type=ErrorType.TRANSACTION_FAILED,
-                                 error_message=f"RETRY. Insert pending for {request.client_request_id}")
+            return ApiResult(error_type=ErrorType.TRANSACTION_FAILED,
+                             error_message=f"RETRY. Insert pending for {request.client_request_id}")
 
-            instrument = self.__instruments.get_instrument(InstrumentId(self.__exchange_name, request.symbol))
-            base_ccy_symbol = instrument.base_currency
-            quote_ccy_symbol = instrument.quote_currency
+        base_ccy_symbol, quote_ccy_symbol, instrument = self.__split_symbol_to_base_quote_ccy(request.symbol)
 
-            timeout_s = None
-            if 'timeout_s' in params:
-                timeout_s = int(time.time() + params['timeout_s'])
-            request.deadline_since_epoch_s = timeout_s
+        timeout_s = None
+        if 'timeout_s' in params:
+            timeout_s = self.__deadline_since_epoch_s(params['timeout_s'])
+        request.deadline_since_epoch_s = timeout_s
 
-            request.base_ccy_qty = Decimal(params["base_ccy_qty"])
-            request.quote_ccy_qty = Decimal(params["quote_ccy_qty"])
+        request.base_ccy_qty = _to_decimal(params["base_ccy_qty"])
+        request.quote_ccy_qty = _to_decimal(params["quote_ccy_qty"])
 
-            if not self.__validate_tokens_address(instrument.native_code, base_ccy_symbol, quote_ccy_symbol):
-                ApiResult(error_type=ErrorType.TRANSACTION_FAILED, error_message='unexpected instrument native code')
+        if not self.__validate_tokens_address(instrument.native_code, base_ccy_symbol, quote_ccy_symbol):
+            ApiResult(error_type=ErrorType.TRANSACTION_FAILED, error_message='unexpected instrument native code')
 
-            if request.side == Side.BUY:
-                result = await self._api.swap_exact_output_single(
-                    quote_ccy_symbol, base_ccy_symbol, request.quote_ccy_qty, request.base_ccy_qty, request.fee_rate,
-                    timeout_s, request.gas_limit, gas_price_wei, nonce=request.nonce)
-            else:
-                result = await self._api.swap_exact_input_single(
-                    base_ccy_symbol, quote_ccy_symbol, request.base_ccy_qty, request.quote_ccy_qty, request.fee_rate,
-                    timeout_s, request.gas_limit, gas_price_wei, nonce=request.nonce)
-
-            self.__tx_hash_to_order_info[result.tx_hash] = OrderInfo(gas_price_wei, request.base_ccy_qty,
-                                                                     request.quote_ccy_qty)
-        elif request.request_type == RequestType.TRANSFER:
-            result = await self._api.withdraw(request.symbol, request.address_to, request.amount,
-                                              request.gas_limit, gas_price_wei, nonce=request.nonce)
-        elif request.request_type == RequestType.APPROVE:
-            result = await self._api.approve(request.symbol, request.amount, request.gas_limit,
-                                             gas_price_wei, nonce=request.nonce)
+        if request.side == Side.BUY:
+            result = await self._api.swap_exact_output_single(
+                quote_ccy_symbol, base_ccy_symbol, request.quote_ccy_qty, request.base_ccy_qty, request.fee_rate,
+                timeout_s, request.gas_limit, gas_price_wei, nonce=request.nonce)
         else:
+            result = await self._api.swap_exact_input_single(
+                base_ccy_symbol, quote_ccy_symbol, request.base_ccy_qty, request.quote_ccy_qty, request.fee_rate,
+                timeout_s, request.gas_limit, gas_price_wei, nonce=request.nonce)
+
+        self.__tx_hash_to_order_info[result.tx_hash] = OrderInfo(gas_price_wei, request.base_ccy_qty,
+                                                                 request.quote_ccy_qty)
+        return result
+
+    async def __amend_transfer(self, request: TransferRequest, params, gas_price_wei) -> ApiResult:
+        return await self._api.withdraw(request.symbol, request.address_to, request.amount,
+                                        request.gas_limit, gas_price_wei, nonce=request.nonce)
+
+    async def __amend_approve(self, request: ApproveRequest, params, gas_price_wei) -> ApiResult:
+        return await self._api.approve(request.symbol, request.amount, request.gas_limit,
+                                       gas_price_wei, nonce=request.nonce)
+
+    async def _amend_transaction(self, request: Request, params, gas_price_wei):
+        amend_handler = self.__amend_handlers.get(request.request_type)
+        if amend_handler is None:
             raise Exception('Unsupported request type for amending')
 
+        result: Optional[ApiResult] = await amend_handler(request, params, gas_price_wei)
+
         if result is not None:
             if result.error_type == ErrorType.NO_ERROR:
                 self._api.update_next_nonce_to_use(request.nonce + 1)
         return result
 
     async def _cancel_transaction(self, request: Request, gas_price_wei):
-        if request.request_type in [RequestType.ORDER, RequestType.TRANSFER, RequestType.APPROVE]:
+        if request.request_type in _CANCELLABLE_REQUEST_TYPES:
             try:
                 if request.nonce is None:
                     # TODO - Improvement to do early cancellations can be done here
-                    self._logger.debug(f"Cancellation requested before setting nonce "
-                                       f"for Client Request Id".format(request.client_request_id))
+                    self._logger.debug("Cancellation requested before setting nonce for Client Request Id: %s",
+                                       request.client_request_id)
                     return ApiResult(error_type=ErrorType.TRANSACTION_FAILED,
                                      error_message=f"RETRY. Insert pending for {request.client_request_id}")
 
@@ -348,34 +373,63 @@ class UniswapV3(DexCommon):
 
             await self._event_sink.on_event('ORDER', event)
         else:
-            self._logger.debug(f"On request status update: {request}")
+            self._logger.debug("On request status update: %s", request)
+
+    async def __run_tx_status_ws(self):
+        # The WS subscription and the consumer of its messages are useless without each other, so they run as one
+        # unit: an error escaping either cancels the other and surfaces through the single spawned task
+        if sys.version_info >= (3, 11):
+            async with asyncio.TaskGroup() as task_group:
+                task_group.create_task(self.__get_tx_status_ws())
+                task_group.create_task(self.__receive_ws_messages())
+        else:
+            await asyncio.gather(self.__get_tx_status_ws(), self.__receive_ws_messages())
 
     async def __get_tx_status_ws(self):
-        self.pantheon.spawn(self.__receive_ws_messages())
-
+        retry_delay_s = self.__WS_MIN_RETRY_DELAY_S
         while True:
             try:
+                # Subscribe only once connected, so a subscription attempt is not wasted (and backed off) while the
+                # connection is still being (re)established
+                await self._api.get_public_websocket_status().wait_until_connected()
                 self._logger.info(
                     "[WS] Subscribing to get WS update for all mined transaction for the wallet")
                 await self._api.subscribe_alchemy_mined_transactions(self.msg_queue)
+                retry_delay_s = self.__WS_MIN_RETRY_DELAY_S
+                # Mined transactions are pushed over WS now, REST polling of receipts only needs to reconcile
+                self._transactions_status_poller.set_push_updates_healthy(True)
                 await self._api.get_public_websocket_status().wait_until_disconnected()
-                await self._api.get_public_websocket_status().wait_until_connected()
+                self._transactions_status_poller.set_push_updates_healthy(False)
             except Exception as e:
+                self._transactions_status_poller.set_push_updates_healthy(False)
                 self._logger.exception(
                     f'Error occurred in alchemy_mined_transactions ws subscription: %r', e)
-                await self.pantheon.sleep(2)
+                # Back off exponentially with jitter so a provider outage does not turn into a tight retry loop
+                await self.pantheon.sleep(retry_delay_s + random.uniform(0, 0.5 * retry_delay_s))
+                retry_delay_s = min(retry_delay_s * 2, self.__WS_MAX_RETRY_DELAY_S)
 
     async def __receive_ws_messages(self):
         while True:
-            try:
-                message = await self.msg_queue.get()
-                self._logger.info("[WS] [MESSAGE] %s", message)
+            await self.msg_queue.wait()
+            # All buffered messages are polled together so their receipts are fetched in one round trip and the
+            # resulting ORDER events are sent concurrently rather than one message behind the other
+            tx_hashes = []
+            while self.msg_queue:
+                try:
+                    message = self.msg_queue.popleft()
+                    self._logger.info("[WS] [MESSAGE] %s", message)
 
-                tx_hash = message['params']['result']['hash']
-                await self._transactions_status_poller.poll_for_status([tx_hash])
-            except Exception as e:
-                self._logger.exception(
-                    f'Error occurred while handling WS message: %r', e)
+                    tx_hashes.append(message['params']['result']['hash'])
+                except Exception as e:
+                    self._logger.exception(
+                        f'Error occurred while handling WS message: %r', e)
+
+            if tx_hashes:
+                try:
+                    await self._transactions_status_poller.poll_for_status(tx_hashes)
+                except Exception as e:
+                    self._logger.exception(
+                        f'Error occurred while polling status of tx_hashes={tx_hashes} from WS: %r', e)
 
     def __compute_exec_price(self, request: OrderRequest, tx_receipt: dict):
         try:
@@ -384,74 +438,57 @@ class UniswapV3(DexCommon):
 
                 # 0xc42079f94a6350d7e6235f29174924f928cc2ac818eb64fed8004e115fbcca67 is the topic for the Swap event
                 if topic == '0xc42079f94a6350d7e6235f29174924f928cc2ac818eb64fed8004e115fbcca67':
-                    swap_log = self._api.get_swap_log(log['address'], tx_receipt)
-                    self._logger.debug(f'Swap_log={swap_log}')
+                    self._logger.debug('Swap_log=%s', log)
                     base_ccy_symbol, quote_ccy_symbol, instrument = self.__split_symbol_to_base_quote_ccy(
                         request.symbol)
-                    token0_amount = int(swap_log[0]['args']['amount0'])
-                    token1_amount = int(swap_log[0]['args']['amount1'])
-
-                    if request.side == Side.BUY:
-                        if token0_amount > 0:
-                            base_ccy_amount = Decimal(
-                                self._api.from_native_amount(base_ccy_symbol, abs(token1_amount)))
-                            quote_ccy_amount = Decimal(
-                                self._api.from_native_amount(quote_ccy_symbol, token0_amount))
-                        else:
-                            base_ccy_amount = Decimal(
-                                self._api.from_native_amount(base_ccy_symbol, abs(token0_amount)))
-                            quote_ccy_amount = Decimal(
-                                self._api.from_native_amount(quote_ccy_symbol, token1_amount))
-                    else:
-                        if token0_amount > 0:
-                            base_ccy_amount = Decimal(
-                                self._api.from_native_amount(base_ccy_symbol, token0_amount))
-                            quote_ccy_amount = Decimal(
-                                self._api.from_native_amount(quote_ccy_symbol, abs(token1_amount)))
-                        else:
-                            base_ccy_amount = Decimal(
-                                self._api.from_native_amount(base_ccy_symbol, token1_amount))
-                            quote_ccy_amount = Decimal(
-                                self._api.from_native_amount(quote_ccy_symbol, abs(token0_amount)))
-
-                    request.exec_price = round(
-                        quote_ccy_amount / base_ccy_amount, 8).normalize()
+                    token0_amount, token1_amount = decode_swap_amounts(log)
+
+                    base_native_amount, quote_native_amount = swap_base_quote_native_amounts(
+                        token0_amount, token1_amount, request.side == Side.BUY)
+
+                    base_ccy_amount = Decimal(self._api.from_native_amount(base_ccy_symbol, base_native_amount))
+                    quote_ccy_amount = Decimal(self._api.from_native_amount(quote_ccy_symbol, quote_native_amount))
+                    request.exec_price = swap_exec_price(base_ccy_amount, quote_ccy_amount)
+                    # Orders are single pool swaps, so there is exactly one Swap event per transaction
+                    break
         except Exception as ex:
             self._logger.exception(f'Error occurred while computing execution price of request={request}: %r', ex)
 
     async def start(self, private_key):
-
-        self.__instruments = await self.pantheon.get_instruments_live_source(
-            exchanges=[self.__exchange_name],
-            symbols=[],
-            kinds=[],
-            usage=InstrumentUsageExchanges.TradableOnly,
-            lifecycles=[InstrumentLifecycle.ACTIVE],
-            rmq_conn_name='url')
-
         file_prefix = os.path.dirname(os.path.realpath(__file__))
         addresses_whitelists_file_path = file_prefix + self.__contract_addresses_file_path
-        self._logger.debug(f'Loading addresses whitelists from {addresses_whitelists_file_path}')
-        with open(addresses_whitelists_file_path, 'r') as contracts_address_file:
-            contracts_address_json = json.load(contracts_address_file)[self.__chain_name]
-
-            tokens_list_json = contracts_address_json["tokens"]
-            self.__tokens_from_res_file = {}
-            for token_json in tokens_list_json:
-                symbol = token_json["symbol"]
-                if symbol in self._withdrawal_address_whitelists_from_res_file:
-                    raise RuntimeError(f'Duplicate token : {symbol} in contracts_address file')
-                for withdrawal_address in token_json["valid_withdrawal_addresses"]:
-                    self._withdrawal_address_whitelists_from_res_file[symbol].add(
-                        Web3.to_checksum_address(withdrawal_address))
-
-                if symbol != self.__native_token:
-                    self.__tokens_from_res_file[symbol] = ERC20Token(token_json["symbol"],
-                                                                     Web3.to_checksum_address(token_json["address"]))
-
-            uniswap_router_address = Web3.to_checksum_address(contracts_address_json["uniswap_router_address"])
-
-        await self._api.initialize(private_key, uniswap_router_address, self.__tokens_from_res_file.values())
+        self._logger.debug('Loading addresses whitelists from %s', addresses_whitelists_file_path)
+        # Read and parse the resources file off the event loop so startup does not stall other coroutines
+        contracts_address_bytes = await self.pantheon.loop.run_in_executor(
+            None, Path(addresses_whitelists_file_path).read_bytes)
+        contracts_address_json = orjson.loads(contracts_address_bytes)[self.__chain_name]
+
+        tokens_list_json = contracts_address_json["tokens"]
+        self.__tokens_from_res_file = {}
+        for token_json in tokens_list_json:
+            symbol = token_json["symbol"]
+            if symbol in self._withdrawal_address_whitelists_from_res_file:
+                raise RuntimeError(f'Duplicate token : {symbol} in contracts_address file')
+            for withdrawal_address in token_json["valid_withdrawal_addresses"]:
+                self._withdrawal_address_whitelists_from_res_file[symbol].add(
+                    _to_checksum_address(withdrawal_address))
+
+            if symbol != self.__native_token:
+                self.__tokens_from_res_file[symbol] = ERC20Token(token_json["symbol"],
+                                                                 _to_checksum_address(token_json["address"]))
+
+        uniswap_router_address = _to_checksum_address(contracts_address_json["uniswap_router_address"])
+
+        # the instruments source and the api do not depend on each other, so warm them up concurrently
+        self.__instruments, _ = await asyncio.gather(
+            self.pantheon.get_instruments_live_source(
+                exchanges=[self.__exchange_name],
+                symbols=[],
+                kinds=[],
+                usage=InstrumentUsageExchanges.TradableOnly,
+                lifecycles=[InstrumentLifecycle.ACTIVE],
+                rmq_conn_name='url'),
+            self._api.initialize(private_key, uniswap_router_address, self.__tokens_from_res_file.values()))
 
         await super().start(private_key)
 
@@ -459,17 +496,24 @@ class UniswapV3(DexCommon):
         self._api.initialize_starting_nonce(max_nonce_loaded + 1)
 
         if self._config.get('ws_subscription_for_mined_txs', True):
-            self.pantheon.spawn(self.__get_tx_status_ws())
+            self.__tasks.append(self.pantheon.spawn(self.__run_tx_status_ws()))
 
         self.started = True
 
+    async def stop(self):
+        for task in self.__tasks:
+            task.cancel()
+        await asyncio.gather(*self.__tasks, return_exceptions=True)
+        self.__tasks.clear()
+        await super().stop()
+
     async def __wrap_unwrap_token(self, path, params: dict, received_at_ms):
         client_request_id = ''
         try:
             client_request_id = params['client_request_id']
             request = params['request']
             assert request == 'wrap' or request == 'unwrap', 'Unknown request, should be either wrap or unwrap'
-            amount = Decimal(params['amount'])
+            amount = _to_decimal(params['amount'])
             gas_price_wei = int(params['gas_price_wei'])
             gas_limit = int(params['gas_limit'])
 
@@ -480,8 +524,8 @@ class UniswapV3(DexCommon):
             wrap_unwrap = WrapUnwrapRequest(
                 client_request_id, request, amount, gas_limit, received_at_ms, token=token, token_address=token_address)
 
-            self._logger.debug(
-                f'{"Wrapping" if wrap_unwrap.request == "wrap" else "Unwrapping"}={wrap_unwrap}, gas_price_wei={gas_price_wei}')
+            self._logger.debug('%s=%s, gas_price_wei=%s', "Wrapping" if wrap_unwrap.request == "wrap" else "Unwrapping",
+                               wrap_unwrap, gas_price_wei)
             self._request_cache.add(wrap_unwrap)
 
             ok, reason = self._check_max_allowed_gas_price(gas_price_wei)
@@ -509,6 +553,7 @@ class UniswapV3(DexCommon):
             return 400, {'error': {'message': repr(ex)}}
 
     def _on_tokens_whitelist_refresh(self, tokens: dict):
+        self.__split_symbol_cache.clear()
         for symbol, (_, address) in tokens.items():
             if symbol == 'ETHAETH':
                 symbol = self.__native_token
@@ -517,10 +562,11 @@ class UniswapV3(DexCommon):
                 assert symbol == self.__native_token
                 continue
 
-            address = Web3.to_checksum_address(address)
-            if symbol in self.__tokens_from_res_file:
-                if address != self.__tokens_from_res_file[symbol].address:
-                    self._logger.error(f'Symbol={symbol} address did not match: API: {address} Resources File: {self.__tokens_from_res_file[symbol].address}')
+            address = _to_checksum_address(address)
+            token_from_res_file = self.__tokens_from_res_file.get(symbol)
+            if token_from_res_file is not None:
+                if address != token_from_res_file.address:
+                    self._logger.error(f'Symbol={symbol} address did not match: API: {address} Resources File: {token_from_res_file.address}')
                 continue
 
             try:
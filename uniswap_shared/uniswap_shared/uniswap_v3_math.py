@@ -0,0 +1,33 @@
+"""
+    Swap log decoding and execution price maths of UniswapV3. They are kept out of uniswap_v3 as they need none of
+    its pantheon/pyutils/web3 dependencies and can be unit tested on their own.
+"""
+from decimal import Decimal
+
+
+def decode_swap_amounts(swap_log) -> tuple:
+    """
+        Decodes (amount0, amount1) from a raw pool Swap event log. They are the first two non-indexed
+        int256 words of Swap(sender, recipient, amount0, amount1, sqrtPriceX96, liquidity, tick).
+    """
+    data = swap_log['data']
+    if isinstance(data, str):
+        data = bytes.fromhex(data[2:] if data.startswith('0x') else data)
+    return int.from_bytes(data[0:32], 'big', signed=True), int.from_bytes(data[32:64], 'big', signed=True)
+
+
+def swap_base_quote_native_amounts(token0_amount: int, token1_amount: int, is_buy: bool) -> tuple:
+    """
+        Native (base, quote) amounts exchanged by a pool swap.
+
+        token0_amount/token1_amount are the signed native amounts of the pool Swap event, the pool receives the sold
+        token (positive amount) and pays out the bought one (negative amount).
+    """
+    token0_is_base = (token0_amount > 0) != is_buy
+    if token0_is_base:
+        return abs(token0_amount), abs(token1_amount)
+    return abs(token1_amount), abs(token0_amount)
+
+
+def swap_exec_price(base_ccy_amount: Decimal, quote_ccy_amount: Decimal) -> Decimal:
+    return round(quote_ccy_amount / base_ccy_amount, 8).normalize()
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 
@@ -14,8 +15,12 @@ from py_dex_common.dexes.dex_common import DexCommon
 from pyutils.exchange_connectors import ConnectorFactory, ConnectorType
 from pyutils.exchange_apis import ApiFactory
 
+_SIDE_BY_NAME = {'BUY': Side.BUY, 'SELL': Side.SELL}
+
 
 class OrderInfo:
+    __slots__ = ('gas_price_wei', 'base_ccy_qty', 'quote_ccy_qty')
+
     def __init__(self, gas_price_wei: int, base_ccy_qty: Decimal, quote_ccy_qty: Decimal):
         self.gas_price_wei: int = gas_price_wei
         self.base_ccy_qty: Decimal = base_ccy_qty
@@ -29,6 +34,7 @@ class UniswapV4(DexCommon):
     NULL_HOOK_ADDRESS = '0x0000000000000000000000000000000000000000'
 
     CHANNELS = ['ORDER']
+    _CANCEL_ALL_REQUEST_TYPES = ('ORDER', 'TRANSFER', 'APPROVE')
 
     def __init__(self, pantheon: Pantheon, config, server, event_sink, connector_type=ConnectorType.UniswapV4):
         super().__init__(pantheon, config, server, event_sink)
@@ -45,20 +51,15 @@ class UniswapV4(DexCommon):
         self.__chain_name = config['chain_name']
         self.__native_token = config["native_token"]
         self.__contract_addresses_file_path = config["resources_file_path"]
-        self.__txn_gas_limit = 1000000
+        self.__txn_gas_limit = int(config.get('txn_gas_limit', 1000000))
+        self.__txn_gas_limit_by_symbol: dict[str, int] = {
+            symbol: int(gas_limit) for symbol, gas_limit in config.get('txn_gas_limit_by_symbol', {}).items()}
 
         self.__tx_hash_to_order_info: dict[str, OrderInfo] = {}
+        # symbol -> (base_ccy_addr, quote_ccy_addr, fee, tick_spacing), cleared on tokens whitelist refresh
+        self.__pool_key_by_symbol: dict[str, tuple] = {}
 
     async def start(self, private_key):
-
-        self.__instruments = await self.pantheon.get_instruments_live_source(
-            exchanges=[self.__exchange_name],
-            symbols=[],
-            kinds=[],
-            usage=InstrumentUsageExchanges.TradableOnly,
-            lifecycles=[InstrumentLifecycle.ACTIVE],
-            rmq_conn_name='url')
-
         file_prefix = os.path.dirname(os.path.realpath(__file__))
         addresses_whitelists_file_path = file_prefix + self.__contract_addresses_file_path
         self._logger.debug(f'Loading addresses whitelists from {addresses_whitelists_file_path}')
@@ -84,9 +85,17 @@ class UniswapV4(DexCommon):
             universal_router_address = Web3.to_checksum_address(contracts_address_json["universal_router_address"])
             permit2_address = Web3.to_checksum_address(contracts_address_json["permit2_address"])
 
-        await self._api.initialize(private_key, chain_id,
-                                   pool_manager_address, universal_router_address, permit2_address,
-                                   self.__tokens_from_res_file.values())
+        self.__instruments, _ = await asyncio.gather(
+            self.pantheon.get_instruments_live_source(
+                exchanges=[self.__exchange_name],
+                symbols=[],
+                kinds=[],
+                usage=InstrumentUsageExchanges.TradableOnly,
+                lifecycles=[InstrumentLifecycle.ACTIVE],
+                rmq_conn_name='url'),
+            self._api.initialize(private_key, chain_id,
+                                 pool_manager_address, universal_router_address, permit2_address,
+                                 self.__tokens_from_res_file.values()))
 
         await super().start(private_key)
 
@@ -95,10 +104,13 @@ class UniswapV4(DexCommon):
 
         self.started = True
 
-    async def __send_order_on_chain(self, request: OrderRequest, gas_price_wei: int) -> ApiResult:
-        inst_def: InstrumentV3 = self.__instruments.get_instrument(InstrumentId(self.__exchange_name, request.symbol))
+    def __get_pool_key(self, symbol: str) -> tuple:
+        pool_key = self.__pool_key_by_symbol.get(symbol)
+        if pool_key is not None:
+            return pool_key
+
+        inst_def: InstrumentV3 = self.__instruments.get_instrument(InstrumentId(self.__exchange_name, symbol))
 
-        # TODO: Cache these poolKey variables
         _, base_ccy_addr, quote_ccy_addr = inst_def.native_code.split('-')
         base_ccy_addr = Web3.to_checksum_address(base_ccy_addr)
         quote_ccy_addr = Web3.to_checksum_address(quote_ccy_addr)
@@ -111,11 +123,18 @@ class UniswapV4(DexCommon):
             raise RuntimeError(f'{inst_def.symbol} missing tick_spacing')
         tick_spacing = custom_fields_dict['tick_spacing']
 
+        pool_key = (base_ccy_addr, quote_ccy_addr, fee, tick_spacing)
+        self.__pool_key_by_symbol[symbol] = pool_key
+        return pool_key
+
+    async def __send_order_on_chain(self, request: OrderRequest, gas_price_wei: int) -> ApiResult:
+        base_ccy_addr, quote_ccy_addr, fee, tick_spacing = self.__get_pool_key(request.symbol)
+
         side = request.side
         client_request_id = request.client_request_id
         try:
             nonce = await self._api.get_next_nonce_to_use()
-            self._logger.info(f"Fetched Nonce :{nonce}, Client Request Id: {client_request_id}")
+            self._logger.info("Fetched Nonce :%s, Client Request Id: %s", nonce, client_request_id)
 
             if side == Side.BUY:
                 # buy 10 AMM-ETH/USDT means we want to buy exactly 10 ETH using X amount of USDT
@@ -156,10 +175,11 @@ class UniswapV4(DexCommon):
         symbol = params['symbol']
         base_ccy_qty = Decimal(params['base_ccy_qty'])
         quote_ccy_qty = Decimal(params['quote_ccy_qty'])
-        assert params['side'] == 'BUY' or params['side'] == 'SELL', 'Unknown order side'
-        side = Side.BUY if params['side'] == 'BUY' else Side.SELL
+        side = _SIDE_BY_NAME.get(params['side'])
+        if side is None:
+            raise ValueError('Unknown order side')
         fee_rate = int(params['fee_rate'])
-        gas_limit = self.__txn_gas_limit
+        gas_limit = self.__txn_gas_limit_by_symbol.get(symbol, self.__txn_gas_limit)
 
         timeout_s = None
         if 'timeout_s' in params:
@@ -170,15 +190,18 @@ class UniswapV4(DexCommon):
         return order
 
     async def _insert_order(self, path, params: dict, received_at_ms: int):
-        client_request_id = ''
         try:
             client_request_id = params['client_request_id']
             gas_price_wei = int(params['gas_price_wei'])
             if self._request_cache.get(client_request_id) is not None:
                 return 400, {'error': {'message': f'client_request_id={client_request_id} is already known'}}
             order = self.__parse_params_to_order(params, received_at_ms)
+        except Exception as e:
+            self._logger.warning('Invalid insert order params: %r', e)
+            return 400, {'error': {'message': repr(e)}}
 
-            self._logger.debug(f'Inserting={order}, gas_price_wei={gas_price_wei}')
+        try:
+            self._logger.debug('Inserting=%s, gas_price_wei=%s', order, gas_price_wei)
             self._request_cache.add(order)
 
             ok, reason = self._check_max_allowed_gas_price(gas_price_wei)
@@ -295,7 +318,7 @@ class UniswapV4(DexCommon):
 
             await self._event_sink.on_event('ORDER', event)
         else:
-            self._logger.debug(f"On request status update: {request}")
+            self._logger.debug("On request status update: %s", request)
 
     def __compute_exec_price(self, request: OrderRequest, tx_receipt: dict):
         try:
@@ -307,11 +330,8 @@ class UniswapV4(DexCommon):
                     continue
 
                 swap_log = self._api.get_swap_log(tx_receipt)
-                self._logger.debug(f'Swap_log={swap_log}')
-                inst_def = self.__instruments.get_instrument(InstrumentId(self.__exchange_name, request.symbol))
-                _, base_ccy_addr, quote_ccy_addr = inst_def.native_code.split('-')
-                base_ccy_addr = Web3.to_checksum_address(base_ccy_addr)
-                quote_ccy_addr = Web3.to_checksum_address(quote_ccy_addr)
+                self._logger.debug('Swap_log=%s', swap_log)
+                base_ccy_addr, quote_ccy_addr, _, _ = self.__get_pool_key(request.symbol)
 
                 token0_amount = int(swap_log[0]['args']['amount0'])
                 token1_amount = int(swap_log[0]['args']['amount1'])
@@ -335,6 +355,7 @@ class UniswapV4(DexCommon):
             self._logger.exception(f'Error occurred while computing execution price of request={request}: %r', ex)
 
     def _on_tokens_whitelist_refresh(self, tokens: dict):
+        self.__pool_key_by_symbol.clear()
         for symbol, (_, address) in tokens.items():
             if symbol == 'ETHAETH':
                 symbol = self.__native_token
@@ -344,10 +365,11 @@ class UniswapV4(DexCommon):
                 continue
 
             address = Web3.to_checksum_address(address)
-            if symbol in self.__tokens_from_res_file:
-                if address != self.__tokens_from_res_file[symbol].address:
+            token_from_res_file = self.__tokens_from_res_file.get(symbol)
+            if token_from_res_file is not None:
+                if address != token_from_res_file.address:
                     self._logger.error(
-                        f'Symbol={symbol} address did not match: API: {address} Resources File: {self.__tokens_from_res_file[symbol].address}')
+                        f'Symbol={symbol} address did not match: API: {address} Resources File: {token_from_res_file.address}')
                 continue
 
             try:
@@ -369,68 +391,19 @@ class UniswapV4(DexCommon):
         return 200, ApiResult()
 
     async def _cancel_all(self, path, params, received_at_ms):
-        try:
-            assert params['request_type'] in ['ORDER', 'TRANSFER', 'APPROVE'], 'Unknown transaction type'
-            request_type = RequestType[params['request_type']]
-
-            self._logger.debug(f'Canceling all requests, request_type={request_type.name}')
-
-            cancel_requested = []
-            failed_cancels = []
-            # TODO- Latency Improvement - use asyncio.gather()
-            for request in self._request_cache.get_all(request_type):
-                try:
-                    if request.request_status != RequestStatus.PENDING or request.nonce is None:
-                        continue
-                    gas_price_wei = self._get_gas_price(request, priority_fee=PriorityFee.Fast)
-                    if request.request_status == RequestStatus.CANCEL_REQUESTED and \
-                            request.used_gas_prices_wei[-1] >= gas_price_wei:
-                        self._logger.info(
-                            f'Not sending cancel request for client_request_id={request.client_request_id} '
-                            f'as cancel with greater than or equal to the gas_price_wei={gas_price_wei} already in progress')
-                        cancel_requested.append(request.client_request_id)
-                        continue
-
-                    if len(request.used_gas_prices_wei) > 0:
-                        gas_price_wei = max(gas_price_wei, int(1.1 * request.used_gas_prices_wei[-1]))
-
-                    ok, reason = self._check_max_allowed_gas_price(gas_price_wei)
-                    if not ok:
-                        self._logger.error(
-                            f'Not sending cancel request for client_request_id={request.client_request_id}: {reason}')
-                        failed_cancels.append(request.client_request_id)
-                        continue
-
-                    self._logger.debug(f'Canceling={request}, gas_price_wei={gas_price_wei}')
-                    result = await self._cancel_transaction(request, gas_price_wei)
-                    if result.error_type == ErrorType.NO_ERROR:
-                        request.tx_hashes.append((result.tx_hash, RequestType.CANCEL.name))
-                        request.used_gas_prices_wei.append(gas_price_wei)
-                        request.request_status = RequestStatus.CANCEL_REQUESTED
-                        self._transactions_status_poller.add_for_polling(result.tx_hash, request.client_request_id,
-                                                                         RequestType.CANCEL)
-                        self._request_cache.maybe_add_or_update_request_in_redis(request.client_request_id)
-                        cancel_requested.append(request.client_request_id)
-                    else:
-                        failed_cancels.append(request.client_request_id)
-
-                except Exception as ex:
-                    self._logger.exception(f'Failed to cancel request={request.client_request_id}: %r', ex)
-                    failed_cancels.append(request.client_request_id)
-
-            return 400 if failed_cancels else 200, {'cancel_requested': cancel_requested,
-                                                    'failed_cancels': failed_cancels}
-        except Exception as e:
-            self._logger.exception(f'Failed to cancel all: %r', e)
-            return 400, {'error': {'message': str(e)}}
+        return await super()._cancel_all(path, params, received_at_ms)
+
+    def _can_cancel(self, request) -> bool:
+        # only requests sent on chain can be cancelled, by replacing their nonce
+        return request.request_status == RequestStatus.PENDING and request.nonce is not None
 
     async def _cancel_transaction(self, request, gas_price_wei):
         if request.request_type in [RequestType.ORDER, RequestType.TRANSFER, RequestType.APPROVE]:
             try:
                 if request.nonce is None:
                     # TODO - Improvement to do early cancellations can be done here
-                    self._logger.debug(f"Cancellation requested before setting nonce "
-                                       f"for Client Request Id".format(request.client_request_id))
+                    self._logger.debug("Cancellation requested before setting nonce for Client Request Id %s",
+                                       request.client_request_id)
                     return ApiResult(error_type=ErrorType.TRANSACTION_FAILED,
                                      error_message=f"RETRY. Insert pending for {request.client_request_id}")
 
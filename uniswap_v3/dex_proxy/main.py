@@ -1,3 +1,5 @@
+import asyncio
+
 from pantheon import Pantheon, StandardArgParser
 from py_dex_common.dex_proxy import DexProxy
 from py_dex_common.web_server import WebServer
@@ -25,6 +27,13 @@ class Main(DexProxy):
 
 
 if __name__ == '__main__':
+    # uvloop is not available on Windows, fall back to the default asyncio loop there
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     pt = Pantheon('uniswap_v3_dex_proxy')
     parser = StandardArgParser('UniswapV3 Dex Proxy')
     pt.load_args_and_config(parser)
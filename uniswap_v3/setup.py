@@ -11,5 +11,6 @@ setup(
     [
         f"uniswap_shared @ file://{uniswap_shared_path}",
         "pyutils[web3] @ git+ssh://git@bitbucket.org/kenetic/pyutils.git@pyutils-1.18.4",
+        "uvloop; sys_platform != 'win32'",
     ]
 )
@@ -18,10 +18,13 @@ from pyutils.exchange_apis.uniswapV3_api import *
 from pyutils.exchange_connectors import ConnectorType
 from . import bundle_pb2
 from py_dex_common.dexes.dex_common import DexCommon
+from py_dex_common.dexes.ws_message_buffer import WsMessageBuffer
 
 from pyutils.exchange_connectors import ConnectorFactory, ConnectorType
 from pyutils.exchange_apis import ApiFactory
 
+_SIDE_BY_NAME = {'BUY': Side.BUY, 'SELL': Side.SELL}
+
 
 class BlockInfo:
     """
@@ -38,6 +41,8 @@ class BlockInfo:
 
 
 class OrderInfo:
+    __slots__ = ('gas_price_wei', 'base_ccy_qty', 'quote_ccy_qty')
+
     def __init__(self, gas_price_wei: int, base_ccy_qty: Decimal, quote_ccy_qty: Decimal):
         self.gas_price_wei = gas_price_wei
         self.base_ccy_qty = base_ccy_qty
@@ -53,7 +58,7 @@ class UniswapV3Bloxroute(DexCommon):
         api_factory = ApiFactory(ConnectorFactory(config["connectors"]))
         self._api = api_factory.create(self.pantheon, ConnectorType.UniswapV3)
 
-        self.msg_queue = asyncio.Queue()
+        self.msg_queue = WsMessageBuffer(config.get('ws_msg_queue_maxsize', 10_000))
         self.__dex_helper = EthRPCDexHelper(pantheon=pantheon, cfg=config["dex_helper"])
 
         self._server.register(
@@ -66,6 +71,8 @@ class UniswapV3Bloxroute(DexCommon):
 
         self.__instruments: InstrumentsLiveSource = None
         self.__exchange_name = config['exchange_name']
+        # symbol -> (base_ccy_symbol, quote_ccy_symbol, instrument), cleared on tokens whitelist refresh
+        self.__split_symbol_cache: Dict[str, tuple] = {}
         self.__chain_name = config['chain_name']
         self.__native_token = config['native_token']
         self.__request_status_poll_ms = config["request_status_poll_ms"]
@@ -96,9 +103,13 @@ class UniswapV3Bloxroute(DexCommon):
         self.__approval_allowed_tokens_contract_map = {'STETH': 'WSTETH'}
 
     def __split_symbol_to_base_quote_ccy(self, symbol):
-        instrument = self.__instruments.get_instrument(
-            InstrumentId(self.__exchange_name, symbol))
-        return instrument.base_currency, instrument.quote_currency, instrument
+        split_symbol = self.__split_symbol_cache.get(symbol)
+        if split_symbol is None:
+            instrument = self.__instruments.get_instrument(
+                InstrumentId(self.__exchange_name, symbol))
+            split_symbol = (instrument.base_currency, instrument.quote_currency, instrument)
+            self.__split_symbol_cache[symbol] = split_symbol
+        return split_symbol
 
     def __get_signed_transaction_from_client_info(self, request: Request, gas_price_wei: int) -> object:
         """
@@ -168,8 +179,9 @@ class UniswapV3Bloxroute(DexCommon):
         symbol = params['symbol']
         base_ccy_qty = Decimal(params['base_ccy_qty'])
         quote_ccy_qty = Decimal(params['quote_ccy_qty'])
-        assert params['side'] == 'BUY' or params['side'] == 'SELL', 'Unknown order side'
-        side = Side.BUY if params['side'] == 'BUY' else Side.SELL
+        side = _SIDE_BY_NAME.get(params['side'])
+        if side is None:
+            raise ValueError('Unknown order side')
         fee_rate = int(params['fee_rate'])
         gas_limit = 500000  # TODO: Check for the most suitable value
         timeout_s = 0  # it will be set properly in further code before sending to builders
@@ -178,7 +190,6 @@ class UniswapV3Bloxroute(DexCommon):
         return order
 
     async def __insert_order(self, path, params: dict, received_at_ms):
-        client_request_id = ''
         try:
             client_request_id = params['client_request_id']
             gas_price_wei = int(params['gas_price_wei'])
@@ -186,10 +197,15 @@ class UniswapV3Bloxroute(DexCommon):
                 return 400, {'error': {'message': f'client_request_id={client_request_id} is already known'}}
 
             order = self.__parse_params_to_order(params, received_at_ms)
+        except Exception as e:
+            self._logger.warning('Invalid insert order params: %r', e)
+            return 400, {'error': {'message': repr(e)}}
+
+        try:
             next_block_num, next_block_uuid, next_block_expected_time_s = self.__update_and_get_next_block_num()
             order.deadline_since_epoch_s = next_block_expected_time_s + self.__order_deadline_buffer_s
             base_ccy_symbol, quote_ccy_symbol, instrument = self.__split_symbol_to_base_quote_ccy(order.symbol)
-            self._logger.debug(f'Inserting={order}, gas_price_wei={gas_price_wei}')
+            self._logger.debug('Inserting=%s, gas_price_wei=%s', order, gas_price_wei)
             self._request_cache.add(order)
 
             if not self.__validate_tokens_address(instrument.native_code, base_ccy_symbol, quote_ccy_symbol):
@@ -251,7 +267,7 @@ class UniswapV3Bloxroute(DexCommon):
 
             request = ApproveRequest(client_request_id, token, amount, gas_limit, path, received_at_ms,
                                      approve_contract_address=approve_contract.address)
-            self._logger.debug(f'Approving={request}, gas_price_wei={gas_price_wei}')
+            self._logger.debug('Approving=%s, gas_price_wei=%s', request, gas_price_wei)
 
             self._request_cache.add(request)
 
@@ -429,7 +445,7 @@ class UniswapV3Bloxroute(DexCommon):
 
                     new_raw_txns_in_block.append(new_raw_tx)
                     self._transactions_status_poller.add_for_polling(new_tx_hash, client_id_for_tx, request_of_client_id.request_type)
-                    self._logger.debug(f"Amended {request_of_client_id}. Decreased nonce by 1.")
+                    self._logger.debug("Amended %s. Decreased nonce by 1.", request_of_client_id)
                     self._request_cache.maybe_add_or_update_request_in_redis(client_id_for_tx)
                 else:
                     # transactions before cancelled transaction.
@@ -539,7 +555,7 @@ class UniswapV3Bloxroute(DexCommon):
 
             await self._event_sink.on_event('ORDER', event)
         else:
-            self._logger.debug(f'On request status update: {request}')
+            self._logger.debug('On request status update: %s', request)
 
     async def __get_tx_status_ws(self):
         self.pantheon.spawn(self.__get_mined_tx_hash())
@@ -558,15 +574,24 @@ class UniswapV3Bloxroute(DexCommon):
 
     async def __get_mined_tx_hash(self):
         while True:
-            try:
-                message = await self.msg_queue.get()
-                self._logger.info("[WS] [MESSAGE] %s", message)
+            await self.msg_queue.wait()
+            tx_hashes = []
+            while self.msg_queue:
+                try:
+                    message = self.msg_queue.popleft()
+                    self._logger.info("[WS] [MESSAGE] %s", message)
 
-                tx_hash = message['params']['result']['hash']
-                await self._transactions_status_poller.poll_for_status([tx_hash])
-            except Exception as e:
-                self._logger.exception(
-                    f'Error occurred while handling WS message: %r', e)
+                    tx_hashes.append(message['params']['result']['hash'])
+                except Exception as e:
+                    self._logger.exception(
+                        f'Error occurred while handling WS message: %r', e)
+
+            if tx_hashes:
+                try:
+                    await self._transactions_status_poller.poll_for_status(tx_hashes)
+                except Exception as e:
+                    self._logger.exception(
+                        f'Error occurred while polling status of tx_hashes={tx_hashes} from WS: %r', e)
 
     def __compute_exec_price(self, request: OrderRequest, tx_receipt: dict):
         try:
@@ -577,7 +602,7 @@ class UniswapV3Bloxroute(DexCommon):
                 if topic == '0xc42079f94a6350d7e6235f29174924f928cc2ac818eb64fed8004e115fbcca67':
                     swap_log = self._api.get_swap_log(
                         log['address'], tx_receipt)
-                    self._logger.debug(f'Swap_log={swap_log}')
+                    self._logger.debug('Swap_log=%s', swap_log)
                     # https://docs.uniswap.org/contracts/v3/reference/core/interfaces/pool/IUniswapV3PoolEvents#swap
 
                     # Sample swap_log:
@@ -591,10 +616,7 @@ class UniswapV3Bloxroute(DexCommon):
 
                     # positive amount means that the corresponding token is added to the pool while negative amount means corresponding token is taken out of the pool
 
-                    instrument = self.__instruments.get_instrument(
-                        InstrumentId(self.__exchange_name, request.symbol))
-                    base_ccy_symbol = instrument.base_currency
-                    quote_ccy_symbol = instrument.quote_currency
+                    base_ccy_symbol, quote_ccy_symbol, _ = self.__split_symbol_to_base_quote_ccy(request.symbol)
 
                     token0_amount = int(swap_log[0]['args']['amount0'])
                     token1_amount = int(swap_log[0]['args']['amount1'])
@@ -663,7 +685,7 @@ class UniswapV3Bloxroute(DexCommon):
                         targeted_block_data = await self._api.get_block(targeted_block_num)
                         block_num_vs_block_data[targeted_block_num] = targeted_block_data
 
-                        self._logger.debug(f'block_num={targeted_block_num}, block_data={targeted_block_data}')
+                        self._logger.debug('block_num=%s, block_data=%s', targeted_block_num, targeted_block_data)
                     else:
                         targeted_block_data = block_num_vs_block_data[targeted_block_num]
 
@@ -691,7 +713,7 @@ class UniswapV3Bloxroute(DexCommon):
                         await self.on_request_status_update(request.client_request_id, RequestStatus.FAILED, None)
 
                 except BlockNotFound:
-                    self._logger.debug(f"Got BlockNotFound while polling tx_hashes of request={request}")
+                    self._logger.debug("Got BlockNotFound while polling tx_hashes of request=%s", request)
                 except Exception as ex:
                     self._logger.exception(f'Error in polling status of request={request}: %r', ex)
 
@@ -748,16 +770,18 @@ class UniswapV3Bloxroute(DexCommon):
         self.started = True
 
     def _on_tokens_whitelist_refresh(self, tokens: dict):
+        self.__split_symbol_cache.clear()
         for symbol, (_, address) in tokens.items():
             if len(address) == 0:
                 assert symbol == self.__native_token
                 continue
 
             address = Web3.to_checksum_address(address)
-            if symbol in self.__tokens_from_res_file:
-                if address != self.__tokens_from_res_file[symbol].address:
+            token_from_res_file = self.__tokens_from_res_file.get(symbol)
+            if token_from_res_file is not None:
+                if address != token_from_res_file.address:
                     self._logger.error(
-                        f'Symbol={symbol} address did not match: API: {address} Resources File: {self.__tokens_from_res_file[symbol].address}')
+                        f'Symbol={symbol} address did not match: API: {address} Resources File: {token_from_res_file.address}')
                 continue
 
             try:
@@ -872,7 +896,7 @@ class UniswapV3Bloxroute(DexCommon):
                     signed_header["X-Flashbots-Signature"] = flashbot_signature
 
                     signed_at_ms = int(time.time() * 1_000)
-                    self._logger.info(f'stat=signBundleTelem, responseDelayMs={signed_at_ms - sign_begin_at_ms}')
+                    self._logger.info('stat=signBundleTelem, responseDelayMs=%s', signed_at_ms - sign_begin_at_ms)
 
                 bundle_jobs.append(self._shoot_bundle_rest(builder_rpc_url, signed_header, rest_str, bundle_id))
             else:
@@ -903,10 +927,10 @@ class UniswapV3Bloxroute(DexCommon):
                 or (response["result"] == "nil")
                 or (isinstance(response["result"], dict) and "bundleHash" in response["result"])
             ):
-                self._logger.info(f"Success: Post to {builder_url}, response {response}, bundle_id: {bundle_id}")
+                self._logger.info("Success: Post to %s, response %s, bundle_id: %s", builder_url, response, bundle_id)
             else:
                 self._logger.error(f"Error: Post to {builder_url}, response: {response}, bundle_id: {bundle_id}")
-            self._logger.info(f"stat=bundleTelem, builder={builder_url}, responseDelayMs={resp_rece_at_ms - send_at_ms}")
+            self._logger.info("stat=bundleTelem, builder=%s, responseDelayMs=%s", builder_url, resp_rece_at_ms - send_at_ms)
         except Exception as e:
             if resp_rece_at_ms is None:
                 resp_rece_at_ms = int(time.time() * 1_000)
@@ -921,7 +945,7 @@ class UniswapV3Bloxroute(DexCommon):
                 async for msg in self._titan_ws:
                     response = json.loads(msg)
                     if "result" in response and "bundleHash" in response["result"] and "error" in response and response["error"] is None:
-                        self._logger.info(f"Successfully sent to Titan via ws: {response}")
+                        self._logger.info("Successfully sent to Titan via ws: %s", response)
                     else:
                         self._logger.error(f"Failed to send to Titan via ws: {response}")
             except websockets.ConnectionClosed: